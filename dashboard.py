@@ -15,18 +15,25 @@ F1-F4 or 1-4 to switch panels
 import pygame
 import sys
 import os
+import re
 import json
+import math
 import time
+import heapq
+import queue
+import atexit
 import threading
 import subprocess
 import requests
 import pty
-import select
 import fcntl
 import struct
 import termios
 from datetime import datetime
-from collections import deque
+from collections import deque, OrderedDict
+from functools import lru_cache, partial
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 
 try:
@@ -36,6 +43,11 @@ except ImportError:
     subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyte'], check=True)
     import pyte
 
+try:
+    import orjson  # Optional: much faster JSON encode/decode, stdlib json fallback
+except ImportError:
+    orjson = None
+
 # Configuration
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 480
@@ -44,10 +56,20 @@ GATEWAY_TOKEN = "8ee708fa05cfe60da1182554737e8f556ff0333784479bf9"
 AGENT_ID = "main"
 SETTINGS_FILE = Path.home() / '.openclaw' / 'workspace' / 'dashboard' / 'settings.json'
 TASKS_FILE = Path.home() / '.openclaw' / 'workspace' / 'dashboard' / 'local_tasks.json'
+SESSIONS_INDEX_FILE = Path.home() / '.openclaw' / 'workspace' / 'dashboard' / 'sessions_index.json'
 
 # Terminal config
 TERM_COLS = 95
 TERM_ROWS = 24
+_WINSZ = struct.Struct('HHHH')  # struct winsize for TIOCSWINSZ
+
+# Unit-circle tables starting at 12 o'clock: 60 seconds-ring dots, 100 gauge ticks
+_RING_ANGLES = [(i / 60) * 2 * math.pi - math.pi / 2 for i in range(60)]
+_RING_COS = tuple(map(math.cos, _RING_ANGLES))
+_RING_SIN = tuple(map(math.sin, _RING_ANGLES))
+_GAUGE_ANGLES = [(i / 100) * 2 * math.pi - math.pi / 2 for i in range(100)]
+_GAUGE_COS = tuple(map(math.cos, _GAUGE_ANGLES))
+_GAUGE_SIN = tuple(map(math.sin, _GAUGE_ANGLES))
 
 # Color palette
 C = {
@@ -106,13 +128,175 @@ MODE_KANBAN = 3
 MODE_COMMANDS = 4
 MODE_NAMES = ['Home', 'Tasks', 'Chat', 'Kanban', 'Cmds']
 TAB_NAMES = ['Home', 'Tasks', 'Chat', 'Kanban']  # Only show 4 tabs (no Cmds)
+TAB_W = SCREEN_WIDTH // len(TAB_NAMES)
+TAB_H = 36
+
+# Global function keys -> mode
+FKEY_MODES = {
+    pygame.K_F1: MODE_DASHBOARD,
+    pygame.K_F2: MODE_TASKS,
+    pygame.K_F3: MODE_CHAT,
+    pygame.K_F4: MODE_KANBAN,
+    pygame.K_F5: MODE_COMMANDS,
+}
+
+# Command cards and the System submenu - static data, built once
+COMMANDS = (
+    {
+        'label': 'Restart Dashboard',
+        'desc': 'Reload this interface',
+        'cmd': '__restart_dashboard__',
+        'icon': '1',
+        'color': C['accent'],
+        'category': 'safe'
+    },
+    {
+        'label': 'System',
+        'desc': 'System tools & diagnostics',
+        'cmd': '__system_menu__',
+        'icon': '2',
+        'color': C['accent'],
+        'category': 'submenu'
+    },
+    {
+        'label': 'OpenClaw TUI',
+        'desc': 'Launch terminal with TUI',
+        'cmd': '__launch_tui__',
+        'icon': '3',
+        'color': (100, 180, 255),
+        'category': 'safe'
+    },
+    {
+        'label': 'Screen Off',
+        'desc': 'Turn off display (any key to wake)',
+        'cmd': '__screen_off__',
+        'icon': '4',
+        'color': (100, 100, 120),
+        'category': 'safe'
+    },
+    {
+        'label': 'Consciousness',
+        'desc': 'TUI with consciousness session',
+        'cmd': '__launch_consciousness__',
+        'icon': '5',
+        'color': (180, 100, 255),
+        'category': 'safe'
+    },
+    {
+        'label': 'Update System',
+        'desc': 'Pull latest code & install',
+        'cmd': 'cd ~/.openclaw && git pull && npm install',
+        'icon': '6',
+        'color': C['warning'],
+        'category': 'caution'
+    },
+    {
+        'label': 'Reboot Pi',
+        'desc': 'Restart the entire system',
+        'cmd': 'sudo reboot',
+        'icon': '7',
+        'color': C['error'],
+        'category': 'danger'
+    },
+    {
+        'label': 'Shutdown',
+        'desc': 'Power off completely',
+        'cmd': 'sudo shutdown -h now',
+        'icon': '8',
+        'color': C['error'],
+        'category': 'danger'
+    },
+)
+
+SYSTEM_SUBMENU = (
+    {'label': 'Node Test', 'cmd': 'openclaw nodes status', 'icon': '1', 'confirm': False},
+    {'label': 'Gateway Test', 'cmd': 'openclaw gateway status', 'icon': '2', 'confirm': False},
+    {'label': 'Disk Space', 'cmd': "df -h / | awk 'NR==2 {print $3 \"/\" $2 \" (\" $5 \" used)\"}'", 'icon': '3', 'confirm': False, 'key': 'DISK'},
+    {'label': 'Gateway Restart', 'cmd': 'systemctl --user restart openclaw-gateway', 'icon': '4', 'confirm': True},
+    {'label': 'Memory Usage', 'cmd': "free -h | awk 'NR==2 {print $3 \"/\" $2}'", 'icon': '5', 'confirm': False, 'key': 'MEM'},
+    {'label': 'CPU Temp', 'cmd': "vcgencmd measure_temp | cut -d= -f2", 'icon': '6', 'confirm': False, 'key': 'TEMP'},
+)
+
+# One shell for all read-only status items: prints KEY:VALUE per line
+STATUS_BATCH_CMD = '; '.join(
+    f'echo "{item["key"]}:$({item["cmd"]})"' for item in SYSTEM_SUBMENU if 'key' in item
+)
+
+# Session key -> friendly name. Anchored alternation keeps the old if/elif priority.
+SESSION_RE = re.compile(
+    r'^(?:(?P<main>.*:main$)|(?P<pi>.*pi-)|(?P<discord>.*discord)|(?P<slack>.*slack)'
+    r'|(?P<whatsapp>.*whatsapp)|(?P<openai>.*openai:)|(?P<cron>.*cron:))'
+)
+SESSION_NAMES = {
+    'main': "📱 Main",
+    'pi': "🖥️ Pi Display",
+    'discord': "💬 Discord",
+    'slack': "💼 Slack",
+    'whatsapp': "📲 WhatsApp",
+    'openai': "🔌 API Session",
+    'cron': "⏰ Scheduled",
+}
+
+
+# Font objects survive text-size changes, so cycling sizes skips the fontconfig lookup
+_FONT_CACHE = {}  # (family, size, bold) -> pygame.font.Font
+
+
+def _font(family, size, bold=False):
+    key = (family, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = pygame.font.SysFont(family, size, bold=bold)
+    return font
+
+
+# Cached formatters for per-frame labels - the values repeat frame after frame
+@lru_cache(maxsize=256)
+def _pct(v):
+    return f"{v}%"
+
+
+@lru_cache(maxsize=128)
+def _temp_c(v):
+    return f"{v}C"
+
+
+@lru_cache(maxsize=256)
+def _count_label(n, noun):
+    return f"{n} {noun}"
+
+
+@lru_cache(maxsize=1024)
+def _countdown(secs):
+    return f"{secs // 60}:{secs % 60:02d}"
+
+
+@lru_cache(maxsize=64)
+def _uptime_fmt(mins):
+    """Uptime label from whole minutes (the display has minute resolution)"""
+    if mins < 60:
+        return f"{mins}m"
+    elif mins < 1440:
+        return f"{mins // 60}h {mins % 60}m"
+    return f"{mins // 1440}d {(mins % 1440) // 60}h"
+
+
+@lru_cache(maxsize=8)
+def _gauge_arc_points(r):
+    """Tick endpoints ((x1, y1), (x2, y2)) for the 100 gauge-arc steps on a 2r-wide surface"""
+    inner_r, outer_r = r - 9, r - 4
+    return tuple(((r + int(inner_r * c), r + int(inner_r * s)), (r + int(outer_r * c), r + int(outer_r * s)))
+                 for c, s in zip(_GAUGE_COS, _GAUGE_SIN))
 
 
 class Message:
     def __init__(self, text, role='user', timestamp=None):
         self.text = text
         self.role = role
-        self.timestamp = timestamp or datetime.now()
+        self.timestamp = timestamp or time.time()  # Epoch float; format only if a view ever shows it
+        self.lines = None  # Wrapped display lines, filled on first draw
+        self.surfs = None  # Rendered lines, built alongside self.lines
+        self.font_gen = -1  # DashboardApp._font_gen the lines were wrapped for
 
 
 class Settings:
@@ -127,28 +311,28 @@ class Settings:
     def load(self):
         try:
             if SETTINGS_FILE.exists():
-                with open(SETTINGS_FILE) as f:
-                    data = json.load(f)
-                    self.text_size = data.get('text_size', 'medium')
-                    self.session_key = data.get('session_key', 'pi-display')
-                    self.last_mode = data.get('last_mode', MODE_DASHBOARD)
-                    self.archived_sessions = data.get('archived_sessions', [])
-                    self.session_renames = data.get('session_renames', {})
-        except:
+                raw = SETTINGS_FILE.read_bytes()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                self.text_size = data.get('text_size', 'medium')
+                self.session_key = data.get('session_key', 'pi-display')
+                self.last_mode = data.get('last_mode', MODE_DASHBOARD)
+                self.archived_sessions = data.get('archived_sessions', [])
+                self.session_renames = data.get('session_renames', {})
+        except (OSError, ValueError, AttributeError):
             pass
 
     def save(self):
         try:
             SETTINGS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump({
-                    'text_size': self.text_size,
-                    'session_key': self.session_key,
-                    'last_mode': self.last_mode,
-                    'archived_sessions': self.archived_sessions,
-                    'session_renames': self.session_renames
-                }, f)
-        except:
+            data = {
+                'text_size': self.text_size,
+                'session_key': self.session_key,
+                'last_mode': self.last_mode,
+                'archived_sessions': self.archived_sessions,
+                'session_renames': self.session_renames
+            }
+            SETTINGS_FILE.write_bytes(orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8'))
+        except (OSError, TypeError):
             pass
 
 
@@ -163,6 +347,9 @@ class Terminal:
         self.master_fd = None
         self.pid = None
         self.started = False
+        self._auto_cmd = None  # Sent once the shell prints its first output
+        self._raw_buf = bytearray()  # pty output waiting for the next flush()
+        self._last_feed = 0
 
     def start(self, command=['bash', '--login'], auto_command='openclaw tui --url ws://127.0.0.1:18789 --token 8ee708fa05cfe60da1182554737e8f556ff0333784479bf9'):
         if self.started:
@@ -180,39 +367,49 @@ class Terminal:
             os.execvpe(command[0], command, env)
         else:
             # Parent
-            flags = fcntl.fcntl(self.master_fd, fcntl.F_GETFL)
-            fcntl.fcntl(self.master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+            os.set_blocking(self.master_fd, False)
             # Set terminal size
-            size = struct.pack('HHHH', self.rows, self.cols, 0, 0)
+            size = _WINSZ.pack(self.rows, self.cols, 0, 0)
             fcntl.ioctl(self.master_fd, termios.TIOCSWINSZ, size)
             self.started = True
 
-            # Auto-run command after shell starts
-            if auto_command:
-                time.sleep(0.5)  # Let bash initialize
-                self.write(auto_command + '\n')
+            # Auto-run command once bash has printed its prompt (see read())
+            self._auto_cmd = auto_command
 
     def read(self):
         if not self.started or self.master_fd is None:
             return
         try:
+            # master_fd is non-blocking: drain until the pty raises BlockingIOError.
+            # A pty hands out ~4K per read, so a short read does not mean it is empty
             while True:
-                r, _, _ = select.select([self.master_fd], [], [], 0)
-                if not r:
+                try:
+                    data = os.read(self.master_fd, 4096)
+                except BlockingIOError:
                     break
-                data = os.read(self.master_fd, 4096)
-                if data:
-                    self.stream.feed(data.decode('utf-8', errors='replace'))
-                else:
+                if not data:
                     break
+                self._raw_buf += data
+                if self._auto_cmd:
+                    cmd, self._auto_cmd = self._auto_cmd, None
+                    self.write(cmd + '\n')
         except (OSError, IOError):
             pass
 
+    def flush(self, now):
+        """Feed buffered output to pyte at most every 33ms (or once 32K piles up)"""
+        if self._raw_buf and (now - self._last_feed > 0.033 or len(self._raw_buf) > 32768):
+            self.stream.feed(self._raw_buf.decode('utf-8', errors='replace'))
+            self._raw_buf.clear()
+            self._last_feed = now
+            return True
+        return False
+
     def write(self, data):
         if self.started and self.master_fd:
             try:
                 os.write(self.master_fd, data.encode('utf-8'))
-            except:
+            except OSError:
                 pass
 
     def send_key(self, key):
@@ -238,21 +435,28 @@ class DashboardApp:
 
         # Enable key repeat (delay 400ms, repeat every 50ms)
         pygame.key.set_repeat(400, 50)
+        pygame.key.start_text_input()  # Typed characters arrive as TEXTINPUT (IME-safe, no control keys)
+        self._text_ctx_at_key = None
 
         # Initialize clipboard
         try:
             pygame.scrap.init()
-        except:
+        except pygame.error:
             pass  # Clipboard may not be available
 
+        # No HWSURFACE: SDL2 ignores it. Cached helper surfaces are convert()ed
+        # to the display format so blits take SDL's fast path.
         self.screen = pygame.display.set_mode(
             (SCREEN_WIDTH, SCREEN_HEIGHT),
-            pygame.FULLSCREEN | pygame.HWSURFACE | pygame.DOUBLEBUF
+            pygame.FULLSCREEN | pygame.DOUBLEBUF
         )
         pygame.display.set_caption('OpenClaw Dashboard')
         pygame.mouse.set_visible(False)
 
         self.settings = Settings()
+        self._settings_dirty_at = None  # Pending debounced save, see _save_settings_soon()
+        atexit.register(self._flush_settings)
+        self._gradient_cache = {}  # (size, top, bottom) -> pre-rendered linear gradient
         self.rebuild_fonts()
 
         # Current mode
@@ -268,11 +472,18 @@ class DashboardApp:
         self.chat_status = "ready"
         self.chat_menu_open = False
         self.chat_menu_mode = 'sessions'  # 'sessions', 'archived', 'confirm_archive', 'confirm_delete', 'rename'
+        self._chat_menu_bg = None  # Chat view snapshot shown under the open menu
+        self._archived_cache = None  # See _get_archived_sessions()
+        self._sessions_cache = None  # sessions.json metadata, reused while its (mtime, size) holds
+        self._sessions_cache_stat = None
+        self._friendly_cache = {}  # (key, displayName) -> derived session name
+        self._sessions_items = None  # (menu item count, has archived), see _sessions_menu_counts()
         self.chat_menu_selection = 0
         self.chat_menu_scroll = 0  # For scrolling long lists
         self.available_sessions = []
         self.session_rename_text = ""
         self.session_rename_cursor = 0
+        self._rename_cursor_x = 0  # Pixel offset of the rename cursor, updated on edit
         self.session_action_target = None  # Session being acted on
 
         # Terminal state
@@ -281,6 +492,8 @@ class DashboardApp:
 
         # Tasks state (local task list)
         self.tasks = []
+        self._pending_count = 0  # Not-done tasks, kept current by _recount_tasks()
+        self._kanban_card_count = 0  # Cards on the board, kept current by _recount_kanban()
         self.task_selected = 0
         self.task_editing = False
         self.task_edit_text = ""
@@ -292,6 +505,39 @@ class DashboardApp:
         self.weather = None
         self.weather_loading = False
         self.weather_last_load = 0
+        self._text_blits = []  # Text queued by draw_* and flushed in one blits() call
+
+        # Keep procfs/sysfs stat files open; pread re-generates them on every read
+        self._fd_stat = self._open_stat_fd('/proc/stat')
+        self._fd_meminfo = self._open_stat_fd('/proc/meminfo')
+        self._fd_uptime = self._open_stat_fd('/proc/uptime')
+        self._fd_temp = self._open_stat_fd('/sys/class/thermal/thermal_zone0/temp')
+        self._stats_cache = {'cpu': 0, 'mem': 0, 'temp': 0, 'uptime': '?'}
+        self._last_cpu = None  # (idle, total) jiffies from the previous sample
+        self._gauge_arc_cache = {}  # (radius, pct, color) -> pre-rendered progress arc
+        self._glow_cache = {}       # (kind, size, color) -> pre-rendered glow, alpha set per blit
+        self._seconds_ring_cache = {}  # (second, radius) -> pre-rendered seconds ring
+        self._clock_glow_cache = None  # (time_str, glow) for the hero clock halo
+        self._tasks_bg_cols = [None] * 32  # Tasks background phase columns, built on first use
+        self._status_batch = None  # Submenu status values, prefetched on open and dropped on close
+        self.system_submenu_open = False
+        self._bar_cache = {}        # (color, w, h, radius) -> pre-rasterized rounded bar
+        self._overlay_cache = {}    # alpha -> full-screen dimming overlay
+        threading.Thread(target=self._stats_loop, daemon=True).start()
+
+        # Slow file writes (SD card) run in order on one worker instead of the UI thread
+        self._io_queue = queue.Queue()
+        threading.Thread(target=self._job_loop, args=(self._io_queue,), daemon=True).start()
+
+        # Menu commands (up to 30s each) run one at a time on their own long-lived worker
+        self._jobs = queue.Queue()
+        threading.Thread(target=self._job_loop, args=(self._jobs,), daemon=True).start()
+
+        # Pooled keep-alive HTTP - the gateway session carries the token, so it is never used off-box
+        self._gateway = requests.Session()
+        self._gateway.mount('http://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4))
+        self._gateway.headers.update({"Authorization": f"Bearer {GATEWAY_TOKEN}"})
+        self._http = requests.Session()
 
         # Commands state
         self.command_selection = 0
@@ -301,6 +547,64 @@ class DashboardApp:
 
         # Screen off state
         self.screen_off = False
+        self._blanked = False  # Black frame already flipped while screen is off
+
+        # Text cursor blink, toggled by the main loop rather than derived per draw
+        self._cursor_on = True
+        self._next_blink = pygame.time.get_ticks() + 500  # SDL ms ticks
+
+        # Per-mode draw functions, bound once (chat commands may set self.mode directly)
+        self._mode_drawers = {
+            MODE_DASHBOARD: self.draw_dashboard,
+            MODE_TASKS: self.draw_tasks,
+            MODE_CHAT: self.draw_chat,
+            MODE_COMMANDS: self.draw_commands,
+            MODE_KANBAN: self.draw_kanban,
+        }
+
+        # Key dispatch tables (bound once instead of walking if/elif chains per key)
+        self._mode_key_handlers = {
+            MODE_DASHBOARD: self._handle_dashboard_key,
+            MODE_CHAT: self._handle_chat_key,
+            MODE_COMMANDS: self._handle_commands_key,
+            MODE_TASKS: self._handle_tasks_key,
+            MODE_KANBAN: self._handle_kanban_key,
+        }
+        self._global_keys = {(pygame.K_q, True): self._ctrl_q}
+        for key, mode in FKEY_MODES.items():
+            # Function keys switch panels with or without Ctrl held
+            self._global_keys[(key, False)] = self._global_keys[(key, True)] = partial(self.switch_mode, mode)
+        self._dashboard_keys = {
+            pygame.K_g: self._toggle_gateway,                     # Toggle gateway connection
+            pygame.K_t: lambda: self.switch_mode(MODE_TASKS),
+            pygame.K_c: lambda: self.switch_mode(MODE_CHAT),
+            pygame.K_k: lambda: self.switch_mode(MODE_KANBAN),
+        }
+        self._chat_menu_handlers = {
+            'rename': self._handle_rename_input,
+            'confirm_archive': self._handle_confirm_input,
+            'confirm_delete': self._handle_confirm_input,
+            'archived': self._handle_archived_menu,
+        }
+
+        # Per-view animation clocks, advanced by their draw_* each frame by _anim_step
+        # (elapsed time in 30fps-frame units, so speed doesn't depend on the adaptive frame rate)
+        self.home_anim = 0.0
+        self.wow_anim_time = 0
+        self.chat_anim = 0
+        self._anim_step = 1.0
+
+        # Home clock strings, reformatted only when the wall-clock second changes
+        self._clock_second = -1
+        self._clock_fields = None
+
+        # Redraw on demand: input events set this; _frame_is_static() covers views that change on their own
+        self._needs_redraw = True
+
+        # Dirty-rect presentation: draw_* may narrow self._dirty, None = whole screen
+        self._dirty = None
+        self._full_redraw = True
+        self._last_activity = time.monotonic()  # Input/terminal output - run() ticks fast for 0.5s after
 
         self.clock = pygame.time.Clock()
         self.messages.append(Message(f"Session: {self.settings.session_key}", 'system'))
@@ -308,25 +612,122 @@ class DashboardApp:
     def rebuild_fonts(self):
         sizes = TEXT_SIZES[self.settings.text_size]
         self.fonts = {
-            'title': pygame.font.SysFont('liberationsans', sizes['title'], bold=True),
-            'big': pygame.font.SysFont('liberationsans', 72, bold=True),
-            'msg': pygame.font.SysFont('liberationsans', sizes['msg']),
-            'input': pygame.font.SysFont('liberationsans', sizes['input']),
-            'time': pygame.font.SysFont('liberationsans', sizes['time']),
-            'status': pygame.font.SysFont('liberationsans', sizes['status']),
-            'menu': pygame.font.SysFont('liberationsans', 14),
-            'menu_title': pygame.font.SysFont('liberationsans', 16, bold=True),
-            'term': pygame.font.SysFont('liberationmono', 12),
-            'task': pygame.font.SysFont('liberationsans', 13),
-            'button': pygame.font.SysFont('liberationsans', 13, bold=True),
-            'button_desc': pygame.font.SysFont('liberationsans', 11),
+            'title': _font('liberationsans', sizes['title'], True),
+            'big': _font('liberationsans', 72, True),
+            'msg': _font('liberationsans', sizes['msg']),
+            'input': _font('liberationsans', sizes['input']),
+            'time': _font('liberationsans', sizes['time']),
+            'status': _font('liberationsans', sizes['status']),
+            'menu': _font('liberationsans', 14),
+            'menu_title': _font('liberationsans', 16, True),
+            'term': _font('liberationmono', 12),
+            'task': _font('liberationsans', 13),
+            'button': _font('liberationsans', 13, True),
+            'button_desc': _font('liberationsans', 11),
         }
         self.line_height = sizes['line_height']
+        self._text_cache = OrderedDict()  # (text, font, color) -> Surface
+        self._measure_cache = {}          # (font, text) -> pixel width
+        self._trunc_cache = {}            # (text, font, max_px) -> clipped text
+        self._menu_layout = None          # Chat menu geometry, see _chat_menu_layout()
+        self._archived_cache = None       # Clipped archived names depend on the font
+        self._build_tabbar()
+        self._build_dashboard_bg()
+
+        # Wrapped chat lines depend on font metrics - messages re-wrap lazily when drawn
+        self._font_gen = getattr(self, '_font_gen', 0) + 1
+
+    def _text(self, text, font, color):
+        """Render text via an LRU cache - labels rarely change between frames"""
+        key = (text, font, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # Match the display format once so every later blit skips conversion
+            surf = self.fonts[font].render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+            if len(self._text_cache) > 512:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surf
+
+    def _measure(self, font, text):
+        """Pixel width of text in a font, memoized until the fonts change"""
+        key = (font, text)
+        w = self._measure_cache.get(key)
+        if w is None:
+            if len(self._measure_cache) > 4096:
+                self._measure_cache.clear()
+            w = self._measure_cache[key] = self.fonts[font].size(text)[0]
+        return w
+
+    def _truncate_to_px(self, text, font, max_px):
+        """Clip text with an ellipsis to fit max_px, cached per (text, font, width)"""
+        key = (text, font, max_px)
+        out = self._trunc_cache.get(key)
+        if out is None:
+            if self._measure(font, text) <= max_px:
+                out = text
+            else:
+                # Longest prefix that still fits alongside the ellipsis
+                lo, hi = 0, len(text)
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if self._measure(font, text[:mid] + '…') <= max_px:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                out = text[:lo].rstrip() + '…'
+            if len(self._trunc_cache) > 1024:
+                self._trunc_cache.clear()
+            self._trunc_cache[key] = out
+        return out
+
+    def _bar(self, color, w, h, radius=2):
+        """Rounded bar/row highlight, rasterized once per color/size and blitted after"""
+        key = (color, w, h, radius)
+        surf = self._bar_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(surf, color, (0, 0, w, h), border_radius=radius)
+            self._bar_cache[key] = surf
+        return surf
+
+    def _dim_overlay(self, alpha):
+        """Full-screen black overlay for dialogs, built once per alpha level"""
+        overlay = self._overlay_cache.get(alpha)
+        if overlay is None:
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+            overlay.fill((0, 0, 0))
+            overlay.set_alpha(alpha)
+            self._overlay_cache[alpha] = overlay
+        return overlay
+
+    def _flush_text(self):
+        """Blit all queued text in a single call (fblits on pygame-ce)"""
+        if self._text_blits:
+            if hasattr(self.screen, 'fblits'):
+                self.screen.fblits(self._text_blits)
+            else:
+                self.screen.blits(self._text_blits, doreturn=False)
+            self._text_blits = []
+
+    def _save_settings_soon(self):
+        """Coalesce settings writes - run() saves once changes settle for 0.5s"""
+        self._settings_dirty_at = time.monotonic() + 0.5
+
+    def _flush_settings(self):
+        """Write pending settings now (on quit/restart)"""
+        if self._settings_dirty_at is not None:
+            self._settings_dirty_at = None
+            self.settings.save()
 
     def switch_mode(self, mode):
         self.mode = mode
+        self._full_redraw = True
+        self._chat_menu_bg = None
         self.settings.last_mode = mode
-        self.settings.save()
+        self._save_settings_soon()
 
         # Reset command state when leaving commands panel
         if mode != MODE_COMMANDS:
@@ -336,7 +737,21 @@ class DashboardApp:
 
     def load_local_tasks(self):
         """Load tasks from Todoist"""
-        self._load_todoist_tasks()
+        self._refresh_tasks_async()
+
+    def _refresh_tasks_async(self):
+        """Run the todoist CLI on a worker thread - it can block for seconds"""
+        if getattr(self, '_tasks_refreshing', False):
+            return
+        self._tasks_refreshing = True
+        self.todoist_last_sync = time.time()  # Counts attempts too, so a failing CLI isn't retried every frame
+
+        def worker():
+            try:
+                self._load_todoist_tasks()
+            finally:
+                self._tasks_refreshing = False
+        threading.Thread(target=worker, daemon=True).start()
 
     def save_local_tasks(self):
         """No-op - Todoist syncs automatically"""
@@ -350,7 +765,12 @@ class DashboardApp:
                 capture_output=True, text=True, timeout=10
             )
             if result.returncode == 0:
-                raw_tasks = json.loads(result.stdout)
+                # Unchanged output (the usual case for periodic syncs) skips the JSON parse
+                out_hash = hash(result.stdout)
+                if out_hash != getattr(self, '_last_tasks_hash', None):
+                    self._last_raw_tasks = orjson.loads(result.stdout) if orjson else json.loads(result.stdout)
+                    self._last_tasks_hash = out_hash
+                raw_tasks = self._last_raw_tasks
 
                 # Build task dict and identify parent/child relationships
                 task_dict = {}
@@ -379,18 +799,21 @@ class DashboardApp:
                     # Track children
                     parent_id = t.get('parentId')
                     if parent_id:
-                        if parent_id not in children_map:
-                            children_map[parent_id] = []
-                        children_map[parent_id].append(task)
+                        children_map.setdefault(parent_id, []).append(task)
 
-                # Attach subtasks to parents
+                # Attach subtasks to parents, sorting in place only for parents we have
+                by_order = itemgetter('child_order')
                 for parent_id, children in children_map.items():
                     if parent_id in task_dict:
-                        task_dict[parent_id]['subtasks'] = sorted(children, key=lambda x: x['child_order'])
+                        children.sort(key=by_order)
+                        task_dict[parent_id]['subtasks'] = children
 
-                # Build flat list - only top-level tasks (no parentId)
-                self.tasks = [t for t in task_dict.values() if not t['is_subtask']]
-                self.tasks = sorted(self.tasks, key=lambda x: x['child_order'])[:50]
+                # Top-level tasks (no parentId): pick the first 50 by order without sorting the rest
+                tasks = heapq.nsmallest(50, (t for t in task_dict.values() if not t['is_subtask']), key=by_order)
+                # Runs off the UI thread: clamp the selection first so it is valid for the old and new list
+                self.task_selected = min(self.task_selected, max(0, len(tasks) - 1))
+                self.tasks = tasks
+                self._recount_tasks()
 
                 # Initialize expanded state tracking
                 if not hasattr(self, 'task_expanded'):
@@ -400,7 +823,7 @@ class DashboardApp:
                 self.todoist_last_sync = time.time()
             else:
                 self.todoist_sync_status = 'error'
-        except Exception as e:
+        except (subprocess.SubprocessError, OSError, ValueError, KeyError, TypeError):
             self.todoist_sync_status = 'error'
 
     def _todoist_complete_task(self, task_id):
@@ -417,7 +840,7 @@ class DashboardApp:
             else:
                 self.todoist_sync_status = 'error'
                 return False
-        except:
+        except (subprocess.SubprocessError, OSError):
             self.todoist_sync_status = 'error'
             return False
 
@@ -436,7 +859,7 @@ class DashboardApp:
             else:
                 self.todoist_sync_status = 'error'
                 return False
-        except:
+        except (subprocess.SubprocessError, OSError):
             self.todoist_sync_status = 'error'
             return False
 
@@ -454,10 +877,14 @@ class DashboardApp:
             else:
                 self.todoist_sync_status = 'error'
                 return False
-        except:
+        except (subprocess.SubprocessError, OSError):
             self.todoist_sync_status = 'error'
             return False
 
+    def _recount_tasks(self):
+        """Refresh the pending-task count after self.tasks changes"""
+        self._pending_count = sum(1 for t in self.tasks if not t.get('done'))
+
     def add_task(self):
         """Add a new task and enter edit mode"""
         new_task = {
@@ -467,6 +894,7 @@ class DashboardApp:
             'done': False
         }
         self.tasks.insert(0, new_task)
+        self._pending_count += 1
         self.task_selected = 0
         self.task_editing = True
         self.task_edit_text = ''
@@ -478,6 +906,7 @@ class DashboardApp:
             # Note: This only removes from local view, not from Todoist
             # Don't add to undo stack since it's not a Todoist action
             self.tasks.pop(self.task_selected)
+            self._recount_tasks()
             self.save_local_tasks()
             if self.task_selected >= len(self.tasks) and self.tasks:
                 self.task_selected = len(self.tasks) - 1
@@ -524,6 +953,7 @@ class DashboardApp:
 
                     # Remove from local list
                     self.tasks.pop(self.task_selected)
+                    self._pending_count -= 1
                     if self.task_selected >= len(self.tasks) and self.tasks:
                         self.task_selected = len(self.tasks) - 1
 
@@ -552,6 +982,7 @@ class DashboardApp:
                 task = action['task']
                 idx = min(action['index'], len(self.tasks))
                 self.tasks.insert(idx, task)
+                self._recount_tasks()
                 self.task_selected = idx
                 return True
         return False
@@ -570,7 +1001,7 @@ class DashboardApp:
             else:
                 self.todoist_sync_status = 'error'
                 return False
-        except:
+        except (subprocess.SubprocessError, OSError):
             self.todoist_sync_status = 'error'
             return False
 
@@ -622,7 +1053,7 @@ class DashboardApp:
             if pygame.scrap.get_init():
                 pygame.scrap.put(pygame.SCRAP_TEXT, text.encode('utf-8'))
                 return True
-        except:
+        except pygame.error:
             pass
         try:
             # Fallback to xclip
@@ -630,7 +1061,7 @@ class DashboardApp:
             p = subprocess.Popen(['xclip', '-selection', 'clipboard'], stdin=subprocess.PIPE)
             p.communicate(text.encode('utf-8'))
             return True
-        except:
+        except OSError:
             pass
         return False
 
@@ -642,7 +1073,7 @@ class DashboardApp:
                 data = pygame.scrap.get(pygame.SCRAP_TEXT)
                 if data:
                     return data.decode('utf-8').rstrip('\x00')
-        except:
+        except (pygame.error, ValueError):
             pass
         try:
             # Fallback to xclip
@@ -651,28 +1082,32 @@ class DashboardApp:
                                   capture_output=True, text=True, timeout=2)
             if result.returncode == 0:
                 return result.stdout
-        except:
+        except (subprocess.SubprocessError, OSError):
             pass
         return ""
 
     def _get_gateway_status(self):
-        """Check if gateway is connected"""
-        # Cache result for 5 seconds
-        now = time.time()
-        if hasattr(self, '_gw_status_cache') and now - self._gw_status_time < 5:
-            return self._gw_status_cache
-
+        """Check if gateway is connected - a cached dict read; systemctl runs off-thread every 15s"""
+        if not hasattr(self, '_gw_status_cache'):
+            self._gw_status_cache = {'connected': False}
+            self._gw_status_time = 0
+            self._gw_refreshing = False
+        if not self._gw_refreshing and time.time() - self._gw_status_time >= 15:
+            self._gw_refreshing = True
+            threading.Thread(target=self._refresh_gateway_status, daemon=True).start()
+        return self._gw_status_cache
+
+    def _refresh_gateway_status(self):
         try:
             result = subprocess.run(
                 ['systemctl', '--user', 'is-active', 'openclaw-gateway'],
                 capture_output=True, text=True, timeout=2
             )
-            connected = result.stdout.strip() == 'active'
-            self._gw_status_cache = {'connected': connected}
-            self._gw_status_time = now
-            return self._gw_status_cache
-        except:
-            return {'connected': False}
+            self._gw_status_cache = {'connected': result.stdout.strip() == 'active'}
+        except (subprocess.SubprocessError, OSError):
+            self._gw_status_cache = {'connected': False}
+        self._gw_status_time = time.time()
+        self._gw_refreshing = False
 
     def _toggle_gateway(self):
         """Connect or disconnect gateway"""
@@ -683,9 +1118,8 @@ class DashboardApp:
         else:
             # Connect
             subprocess.run(['systemctl', '--user', 'start', 'openclaw-gateway'], timeout=5)
-        # Clear cache
-        if hasattr(self, '_gw_status_cache'):
-            del self._gw_status_cache
+        # Re-check on the next read
+        self._gw_status_time = 0
 
     def load_weather(self):
         if self.weather_loading:
@@ -699,10 +1133,10 @@ class DashboardApp:
     def _load_weather_async(self):
         try:
             # Use wttr.in for simple weather
-            response = requests.get('https://wttr.in/?format=%t+%C', timeout=5)
+            response = self._http.get('https://wttr.in/?format=%t+%C', timeout=5)
             if response.status_code == 200:
                 self.weather = response.text.strip()
-        except:
+        except requests.RequestException:
             self.weather = None
         self.weather_loading = False
         self.weather_last_load = time.time()
@@ -741,30 +1175,37 @@ class DashboardApp:
             url = f"{GATEWAY_URL}/v1/chat/completions"
             headers = {
                 "Content-Type": "application/json",
-                "Authorization": f"Bearer {GATEWAY_TOKEN}",
                 "x-openclaw-session-key": self.settings.session_key
             }
 
             payload = {
                 "model": f"openclaw:{AGENT_ID}",
-                "messages": self.conversation[-10:]
+                "messages": self.conversation[-10:],
+                "stream": True
             }
 
-            response = requests.post(url, headers=headers, json=payload, timeout=120)
-
-            if response.status_code == 200:
-                data = response.json()
-                content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                if content:
-                    self.messages.append(Message(content, 'assistant'))
-                    self.conversation.append({"role": "assistant", "content": content})
-                    self.chat_status = "ready"
+            # Serialize once up front (orjson when available) and send raw bytes
+            body = orjson.dumps(payload) if orjson else json.dumps(payload).encode('utf-8')
+            # Streamed responses hold their pooled socket until closed - the with releases it
+            # on [DONE], on an error status and on exceptions alike
+            with self._gateway.post(url, headers=headers, data=body, stream=True, timeout=120) as response:
+                if response.status_code == 200:
+                    if 'text/event-stream' in response.headers.get('Content-Type', ''):
+                        content = self._read_chat_stream(response)  # Already on screen
+                    else:
+                        data = response.json()
+                        content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
+                        if content:
+                            self.messages.append(Message(content, 'assistant'))
+                    if content:
+                        self.conversation.append({"role": "assistant", "content": content})
+                        self.chat_status = "ready"
+                    else:
+                        self.messages.append(Message("[Empty]", 'system'))
+                        self.chat_status = "ready"
                 else:
-                    self.messages.append(Message("[Empty]", 'system'))
-                    self.chat_status = "ready"
-            else:
-                self.messages.append(Message(f"[HTTP {response.status_code}]", 'system'))
-                self.chat_status = "error"
+                    self.messages.append(Message(f"[HTTP {response.status_code}]", 'system'))
+                    self.chat_status = "error"
         except Exception as e:
             self.messages.append(Message(f"[{str(e)[:25]}]", 'system'))
             self.chat_status = "error"
@@ -772,13 +1213,50 @@ class DashboardApp:
         self.chat_waiting = False
         self.chat_scroll = 0
 
+    def _read_chat_stream(self, response):
+        """Show an SSE reply as it streams in (re-wrapped at most every 100ms), return the full text"""
+        parts = []
+        shown = None
+        last_shown = 0
+
+        def show(text, prev):
+            # Swap in a fresh Message rather than mutating one the draw thread may be wrapping
+            msg = Message(text, 'assistant')
+            if prev is not None and self.messages and self.messages[-1] is prev:
+                self.messages[-1] = msg
+            else:
+                self.messages.append(msg)
+            return msg
+
+        for line in response.iter_lines():
+            if not line.startswith(b'data: '):
+                continue
+            chunk = line[6:]
+            if chunk == b'[DONE]':
+                break
+            try:
+                data = orjson.loads(chunk) if orjson else json.loads(chunk)
+                delta = data['choices'][0].get('delta', {}).get('content')
+            except (ValueError, KeyError, IndexError):
+                continue
+            if delta:
+                parts.append(delta)
+                now = time.monotonic()
+                if now - last_shown >= 0.1:
+                    shown = show(''.join(parts), shown)
+                    last_shown = now
+
+        content = ''.join(parts)
+        if content:
+            show(content, shown)
+        return content
+
     def _chat_send_command(self, cmd):
         """Send OpenClaw slash command (not added to conversation)"""
         try:
             url = f"{GATEWAY_URL}/v1/chat/completions"
             headers = {
                 "Content-Type": "application/json",
-                "Authorization": f"Bearer {GATEWAY_TOKEN}",
                 "x-openclaw-session-key": self.settings.session_key
             }
 
@@ -788,7 +1266,7 @@ class DashboardApp:
                 "messages": [{"role": "user", "content": cmd}]
             }
 
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self._gateway.post(url, headers=headers, json=payload, timeout=30)
 
             if response.status_code == 200:
                 data = response.json()
@@ -828,13 +1306,13 @@ class DashboardApp:
             return True
         elif command == '/session' and args:
             self.settings.session_key = args
-            self.settings.save()
+            self._save_settings_soon()
             self.conversation.clear()
             self.messages.append(Message(f"Session: {args}", 'system'))
             return True
         elif command in ['/new', '/n']:
             self.settings.session_key = f"pi-{datetime.now().strftime('%H%M')}"
-            self.settings.save()
+            self._save_settings_soon()
             self.conversation.clear()
             self.messages.append(Message(f"New: {self.settings.session_key}", 'system'))
             return True
@@ -842,7 +1320,7 @@ class DashboardApp:
             if args[0] in ['s', 'm', 'l']:
                 size_map = {'s': 'small', 'm': 'medium', 'l': 'large'}
                 self.settings.text_size = size_map.get(args[0], args)
-                self.settings.save()
+                self._save_settings_soon()
                 self.rebuild_fonts()
                 self.messages.append(Message(f"Size: {self.settings.text_size}", 'system'))
             return True
@@ -867,7 +1345,7 @@ class DashboardApp:
             self.mode = 3
             return True
         elif command == '/sync':
-            self._load_todoist_tasks()
+            self._refresh_tasks_async()
             self._load_kanban_data()
             self.messages.append(Message("Synced tasks & kanban", 'system'))
             return True
@@ -884,6 +1362,7 @@ class DashboardApp:
             return True
         elif command == '/restart':
             self.messages.append(Message("Restarting...", 'system'))
+            self._flush_settings()
             import os, sys
             os.execv(sys.executable, [sys.executable] + sys.argv)
         elif command in ['/quit', '/exit']:
@@ -898,6 +1377,7 @@ class DashboardApp:
             return
         self._sessions_loading = True
         self.available_sessions = [{'key': 'loading', 'name': 'Loading...'}]
+        self._sessions_items = None
         threading.Thread(target=self._fetch_sessions_async, daemon=True).start()
 
     def _fetch_sessions_async(self):
@@ -906,16 +1386,18 @@ class DashboardApp:
             sessions_file = Path.home() / '.openclaw' / 'agents' / 'main' / 'sessions' / 'sessions.json'
 
             if sessions_file.exists():
-                with open(sessions_file) as f:
-                    data = json.load(f)
+                # The list below is still rebuilt each time: archive state and renames feed into it
+                data = self._load_sessions_metadata(sessions_file)
 
                 # Get all keys to check for duplicates
                 all_keys = set(data.keys())
+                # Set snapshot for O(1) membership; the settings list keeps archive order for the menu
+                archived = set(self.settings.archived_sessions)
 
                 sessions = []
                 for key, s in data.items():
                     # Skip archived sessions
-                    if key in self.settings.archived_sessions:
+                    if key in archived:
                         continue
 
                     # Skip short keys if a full key exists (avoid duplicates)
@@ -934,15 +1416,64 @@ class DashboardApp:
                 self.available_sessions = [{'key': '', 'name': 'No sessions file'}]
         except Exception as e:
             self.available_sessions = [{'key': '', 'name': f'Err: {str(e)[:12]}'}]
+        self._sessions_items = None
         self._sessions_loading = False
 
+    def _load_sessions_metadata(self, sessions_file):
+        """key -> {displayName, updatedAt} for sessions.json, skipping the transcripts when possible"""
+        st = sessions_file.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        if stamp == self._sessions_cache_stat:
+            return self._sessions_cache
+
+        # A lean index written for this exact (mtime, size) saves parsing the full file
+        meta = None
+        try:
+            raw = SESSIONS_INDEX_FILE.read_bytes()
+            index = orjson.loads(raw) if orjson else json.loads(raw)
+            if index.get('source') == stamp:
+                meta = index['sessions']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+
+        if meta is None:
+            raw = sessions_file.read_bytes()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+            meta = {k: {'displayName': v.get('displayName', ''), 'updatedAt': v.get('updatedAt', 0)}
+                    for k, v in data.items()}
+            self._io_queue.put((self._write_sessions_index, ({'source': stamp, 'sessions': meta},)))
+
+        self._sessions_cache, self._sessions_cache_stat = meta, stamp
+        return meta
+
+    def _write_sessions_index(self, index):
+        """Save the lean sessions index (runs on the IO worker)"""
+        SESSIONS_INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        SESSIONS_INDEX_FILE.write_bytes(orjson.dumps(index) if orjson else json.dumps(index).encode('utf-8'))
+
+    def _session_lists_changed(self):
+        """Drop memoized session/archive derivations after sessions or archives change"""
+        self._archived_cache = None
+        self._sessions_items = None
+
+    def _sessions_menu_counts(self):
+        """(item count, has archived) for the sessions menu: New Session + sessions + View Archived"""
+        if self._sessions_items is None:
+            has_archived = bool(self.settings.archived_sessions)
+            self._sessions_items = (1 + len(self.available_sessions) + has_archived, has_archived)
+        return self._sessions_items
+
     def _get_archived_sessions(self):
-        """Get list of archived sessions with names"""
-        archived = []
-        for key in self.settings.archived_sessions:
-            name = self.settings.session_renames.get(key, key.split(':')[-1][:15])
-            archived.append({'key': key, 'name': f"📦 {name}"})
-        return archived
+        """Get list of archived sessions with names (memoized until archive/rename changes)"""
+        if self._archived_cache is None:
+            archived = []
+            for key in self.settings.archived_sessions:
+                name = f"📦 {self.settings.session_renames.get(key, key.split(':')[-1][:15])}"
+                # Row label clipped to the archived menu width once, not per frame
+                archived.append({'key': key, 'name': name,
+                                 'display_name': self._truncate_to_px(name, 'menu', 476)})
+            self._archived_cache = archived
+        return self._archived_cache
 
     def _friendly_session_name(self, key, session_data):
         """Convert session key to friendly display name"""
@@ -950,116 +1481,42 @@ class DashboardApp:
         if key in self.settings.session_renames:
             return self.settings.session_renames[key]
 
-        display = session_data.get('displayName', '')
-
-        if ':main' in key and key.endswith(':main'):
-            return "📱 Main"
-        elif 'pi-' in key or 'pi-display' in key:
-            return "🖥️ Pi Display"
-        elif 'discord' in key:
-            if '#' in display:
-                channel = display.split('#')[-1][:15]
-                return f"💬 #{channel}"
-            return "💬 Discord"
-        elif 'slack' in key:
-            return "💼 Slack"
-        elif 'whatsapp' in key:
-            return "📲 WhatsApp"
-        elif 'openai:' in key:
-            return "🔌 API Session"
-        elif 'cron:' in key:
-            return "⏰ Scheduled"
-        else:
+        # Derived names depend only on the key and displayName, so renames never stale this cache
+        ck = (key, session_data.get('displayName', ''))
+        name = self._friendly_cache.get(ck)
+        if name is None:
+            if len(self._friendly_cache) > 512:
+                self._friendly_cache.clear()
+            name = self._friendly_cache[ck] = self._derive_session_name(key, ck[1])
+        return name
+
+    def _derive_session_name(self, key, display):
+        """Name from the key's SESSION_RE kind (Discord sessions use their channel)"""
+        m = SESSION_RE.match(key)
+        if not m:
             short = key.split(':')[-1][:12]
             return short.replace('-', ' ').title()
 
+        kind = m.lastgroup
+        if kind == 'discord' and '#' in display:
+            channel = display.split('#')[-1][:15]
+            return f"💬 #{channel}"
+        return SESSION_NAMES[kind]
+
     # ===== COMMAND METHODS =====
 
     def get_commands(self):
         """Return list of available commands"""
-        return [
-            {
-                'label': 'Restart Dashboard',
-                'desc': 'Reload this interface',
-                'cmd': '__restart_dashboard__',
-                'icon': '1',
-                'color': C['accent'],
-                'category': 'safe'
-            },
-            {
-                'label': 'System',
-                'desc': 'System tools & diagnostics',
-                'cmd': '__system_menu__',
-                'icon': '2',
-                'color': C['accent'],
-                'category': 'submenu'
-            },
-            {
-                'label': 'OpenClaw TUI',
-                'desc': 'Launch terminal with TUI',
-                'cmd': '__launch_tui__',
-                'icon': '3',
-                'color': (100, 180, 255),
-                'category': 'safe'
-            },
-            {
-                'label': 'Screen Off',
-                'desc': 'Turn off display (any key to wake)',
-                'cmd': '__screen_off__',
-                'icon': '4',
-                'color': (100, 100, 120),
-                'category': 'safe'
-            },
-            {
-                'label': 'Consciousness',
-                'desc': 'TUI with consciousness session',
-                'cmd': '__launch_consciousness__',
-                'icon': '5',
-                'color': (180, 100, 255),
-                'category': 'safe'
-            },
-            {
-                'label': 'Update System',
-                'desc': 'Pull latest code & install',
-                'cmd': 'cd ~/.openclaw && git pull && npm install',
-                'icon': '6',
-                'color': C['warning'],
-                'category': 'caution'
-            },
-            {
-                'label': 'Reboot Pi',
-                'desc': 'Restart the entire system',
-                'cmd': 'sudo reboot',
-                'icon': '7',
-                'color': C['error'],
-                'category': 'danger'
-            },
-            {
-                'label': 'Shutdown',
-                'desc': 'Power off completely',
-                'cmd': 'sudo shutdown -h now',
-                'icon': '8',
-                'color': C['error'],
-                'category': 'danger'
-            },
-        ]
+        return COMMANDS
 
     def get_system_submenu(self):
         """Return system submenu items"""
-        return [
-            {'label': 'Node Test', 'cmd': 'openclaw nodes status', 'icon': '1', 'confirm': False},
-            {'label': 'Gateway Test', 'cmd': 'openclaw gateway status', 'icon': '2', 'confirm': False},
-            {'label': 'Disk Space', 'cmd': "df -h / | awk 'NR==2 {print $3 \"/\" $2 \" (\" $5 \" used)\"}'", 'icon': '3', 'confirm': False},
-            {'label': 'Gateway Restart', 'cmd': 'systemctl --user restart openclaw-gateway', 'icon': '4', 'confirm': True},
-            {'label': 'Memory Usage', 'cmd': "free -h | awk 'NR==2 {print $3 \"/\" $2}'", 'icon': '5', 'confirm': False},
-            {'label': 'CPU Temp', 'cmd': "vcgencmd measure_temp | cut -d= -f2", 'icon': '6', 'confirm': False},
-        ]
+        return SYSTEM_SUBMENU
 
     def execute_command(self, cmd_idx):
         """Execute a command by index"""
-        commands = self.get_commands()
-        if 0 <= cmd_idx < len(commands):
-            cmd = commands[cmd_idx]
+        if 0 <= cmd_idx < len(COMMANDS):
+            cmd = COMMANDS[cmd_idx]
 
             # Special handling for screen off
             if cmd['cmd'] == '__screen_off__':
@@ -1068,6 +1525,7 @@ class DashboardApp:
 
             # Special handling for restart dashboard
             if cmd['cmd'] == '__restart_dashboard__':
+                self._flush_settings()
                 pygame.quit()
                 os.execv(sys.executable, [sys.executable] + sys.argv)
                 return
@@ -1076,6 +1534,8 @@ class DashboardApp:
             if cmd['cmd'] == '__system_menu__':
                 self.system_submenu_open = True
                 self.system_submenu_selection = 0
+                self._status_batch = None
+                threading.Thread(target=self._run_status_batch, daemon=True).start()
                 return
 
             # Special handling for launching TUI
@@ -1106,7 +1566,7 @@ class DashboardApp:
             if cmd.get('category', 'safe') == 'safe':
                 self.command_running = cmd['label']
                 self.command_result = None
-                threading.Thread(target=self._run_command_async, args=(cmd,), daemon=True).start()
+                self._jobs.put((self._run_command_async, (cmd,)))
             else:
                 # Caution/Danger commands need confirmation
                 self.command_confirm = cmd_idx
@@ -1117,11 +1577,10 @@ class DashboardApp:
             return
 
         if confirmed:
-            commands = self.get_commands()
-            cmd = commands[self.command_confirm]
+            cmd = COMMANDS[self.command_confirm]
             self.command_running = cmd['label']
             self.command_result = None
-            threading.Thread(target=self._run_command_async, args=(cmd,), daemon=True).start()
+            self._jobs.put((self._run_command_async, (cmd,)))
 
         self.command_confirm = None
 
@@ -1151,89 +1610,141 @@ class DashboardApp:
 
         # Result stays visible until user presses a key
 
+    def _run_status_batch(self):
+        """Fetch disk/memory/temp in one shell; kept while the system submenu stays open"""
+        values = {}
+        try:
+            result = subprocess.run(['bash', '-c', STATUS_BATCH_CMD],
+                                    capture_output=True, text=True, timeout=10)
+            for line in result.stdout.splitlines():
+                key, sep, value = line.partition(':')
+                if sep and value.strip():
+                    values[key] = value.strip()
+        except (subprocess.SubprocessError, OSError):
+            pass
+        if self.system_submenu_open:
+            self._status_batch = values
+        return values
+
     # ===== DRAWING =====
 
     def draw_tabs(self):
         """Draw tab bar at top - only 4 tabs (Home, Tasks, Chat, Kanban)"""
-        tab_h = 36
-        tab_w = SCREEN_WIDTH // 4  # 4 tabs now
-
+        # Inactive tabs and border come pre-rendered from rebuild_fonts
+        self.screen.blit(self._tabbar_static, (0, 0))
+
+        # Map tab index to mode (0=Home, 1=Tasks, 2=Chat, 3=Kanban)
+        if self.mode < 4:
+            i = self.mode
+            x = i * TAB_W
+            pygame.draw.rect(self.screen, C['bg_tab_active'], (x, 0, TAB_W - 1, TAB_H))
+            pygame.draw.rect(self.screen, C['accent'], (x, TAB_H - 4, TAB_W - 1, 4))
+
+            label = self._tab_labels_active[i]
+            self.screen.blit(label, (x + (TAB_W - label.get_width()) // 2, 9))
+
+            # Version indicator sits on top of the last tab
+            ver_surf = self._tabbar_version
+            self.screen.blit(ver_surf, (SCREEN_WIDTH - ver_surf.get_width() - 8, 12))
+
+    def _build_tabbar(self):
+        """Pre-render the static tab bar chrome (all tabs inactive) and active labels"""
+        surf = pygame.Surface((SCREEN_WIDTH, TAB_H + 1)).convert()
+        surf.fill(C['bg'])
         for i, name in enumerate(TAB_NAMES):
-            x = i * tab_w
-            # Map tab index to mode (0=Home, 1=Tasks, 2=Chat, 3=Kanban)
-            is_active = i == self.mode if self.mode < 4 else False
+            x = i * TAB_W
+            pygame.draw.rect(surf, C['bg_tab'], (x, 0, TAB_W - 1, TAB_H))
+            label = self.fonts['msg'].render(f"F{i+1} {name}", True, C['text_dim'])
+            surf.blit(label, (x + (TAB_W - label.get_width()) // 2, 9))
 
-            color = C['bg_tab_active'] if is_active else C['bg_tab']
-            pygame.draw.rect(self.screen, color, (x, 0, tab_w - 1, tab_h))
+        # Version indicator
+        ver_surf = self.fonts['status'].render("v15", True, C['text_muted']).convert_alpha()
+        surf.blit(ver_surf, (SCREEN_WIDTH - ver_surf.get_width() - 8, 12))
 
-            if is_active:
-                pygame.draw.rect(self.screen, C['accent'], (x, tab_h - 4, tab_w - 1, 4))
+        pygame.draw.line(surf, C['border'], (0, TAB_H), (SCREEN_WIDTH, TAB_H), 1)
 
-            text_color = C['text_bright'] if is_active else C['text_dim']
-            label = self.fonts['msg'].render(f"F{i+1} {name}", True, text_color)
-            self.screen.blit(label, (x + (tab_w - label.get_width()) // 2, 9))
+        self._tabbar_static = surf
+        self._tabbar_version = ver_surf
+        self._tab_labels_active = [
+            self.fonts['msg'].render(f"F{i+1} {name}", True, C['text_bright']).convert_alpha()
+            for i, name in enumerate(TAB_NAMES)
+        ]
 
-        # Version indicator
-        ver_surf = self.fonts['status'].render("v15", True, C['text_muted'])
-        self.screen.blit(ver_surf, (SCREEN_WIDTH - ver_surf.get_width() - 8, 12))
+    @staticmethod
+    def _open_stat_fd(path):
+        """Open a /proc or /sys file for repeated os.pread, or None if missing"""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        atexit.register(os.close, fd)
+        return fd
 
-        pygame.draw.line(self.screen, C['border'], (0, tab_h), (SCREEN_WIDTH, tab_h), 1)
+    def _job_loop(self, jobs):
+        """Run queued (fn, args) jobs one at a time"""
+        while True:
+            fn, args = jobs.get()
+            try:
+                fn(*args)
+            except Exception as e:
+                import traceback
+                print(f"Background job {getattr(fn, '__name__', fn)} failed: {e}", file=sys.stderr)
+                traceback.print_exc()
+                if fn == self._run_command_async:
+                    # Surface command failures on the panel instead of leaving the spinner up
+                    self.command_result = ('error', str(e)[:100])
+                    self.command_running = None
 
     def get_system_stats(self):
-        """Get Pi system stats (cached for 2 seconds)"""
-        now = time.time()
-        if hasattr(self, '_stats_cache') and now - self._stats_cache_time < 2:
-            return self._stats_cache
+        """Latest Pi system stats (refreshed every 2 seconds by _stats_loop)"""
+        return self._stats_cache
 
+    def _stats_loop(self):
+        """Background sampler - keeps procfs reads off the render thread"""
+        while True:
+            self._stats_cache = self._sample_system_stats()  # Atomic swap, no lock needed
+            time.sleep(2)
+
+    def _sample_system_stats(self):
+        """Read CPU, memory, temperature and uptime from procfs/sysfs"""
         stats = {'cpu': 0, 'mem': 0, 'temp': 0, 'uptime': '?'}
 
         try:
-            # CPU usage
-            with open('/proc/stat') as f:
-                line = f.readline()
-                vals = list(map(int, line.split()[1:8]))
-                idle = vals[3]
-                total = sum(vals)
-                if hasattr(self, '_last_cpu'):
-                    diff_idle = idle - self._last_cpu[0]
-                    diff_total = total - self._last_cpu[1]
-                    stats['cpu'] = int(100 * (1 - diff_idle / max(diff_total, 1)))
-                self._last_cpu = (idle, total)
+            # CPU usage - aggregate "cpu" line is first
+            line = os.pread(self._fd_stat, 256, 0).split(b'\n', 1)[0]
+            vals = list(map(int, line.split()[1:8]))
+            idle = vals[3]
+            total = sum(vals)
+            if self._last_cpu is not None:
+                diff_idle = idle - self._last_cpu[0]
+                diff_total = total - self._last_cpu[1]
+                stats['cpu'] = int(100 * (1 - diff_idle / max(diff_total, 1)))
+            self._last_cpu = (idle, total)
         except:
             pass
 
         try:
-            # Memory usage
-            with open('/proc/meminfo') as f:
-                lines = f.readlines()
-                total = int(lines[0].split()[1])
-                avail = int(lines[2].split()[1])
-                stats['mem'] = int(100 * (1 - avail / total))
+            # Memory usage - look fields up by name rather than line position
+            data = os.pread(self._fd_meminfo, 4096, 0)
+            total = int(data.split(b'MemTotal:', 1)[1].split(None, 1)[0])
+            avail = int(data.split(b'MemAvailable:', 1)[1].split(None, 1)[0])
+            stats['mem'] = int(100 * (1 - avail / total))
         except:
             pass
 
         try:
             # Pi temperature
-            with open('/sys/class/thermal/thermal_zone0/temp') as f:
-                stats['temp'] = int(f.read()) // 1000
+            stats['temp'] = int(os.pread(self._fd_temp, 16, 0)) // 1000
         except:
             pass
 
         try:
             # Uptime
-            with open('/proc/uptime') as f:
-                secs = int(float(f.read().split()[0]))
-                if secs < 3600:
-                    stats['uptime'] = f"{secs // 60}m"
-                elif secs < 86400:
-                    stats['uptime'] = f"{secs // 3600}h {(secs % 3600) // 60}m"
-                else:
-                    stats['uptime'] = f"{secs // 86400}d {(secs % 86400) // 3600}h"
+            secs = int(float(os.pread(self._fd_uptime, 64, 0).split(b' ', 1)[0]))
+            stats['uptime'] = _uptime_fmt(secs // 60)
         except:
             pass
 
-        self._stats_cache = stats
-        self._stats_cache_time = now
         return stats
 
     def draw_progress_bar(self, x, y, w, h, pct, color, bg_color=None):
@@ -1244,149 +1755,327 @@ class DashboardApp:
         if fill_w > 0:
             pygame.draw.rect(self.screen, color, (x, y, fill_w, h), border_radius=3)
 
+    def _vgradient(self, size, color_at):
+        """Vertical gradient surface: color_at(progress) per row of a 1px column, stretched in C"""
+        w, h = size
+        has_alpha = len(color_at(0)) == 4
+        if has_alpha:
+            column = pygame.Surface((1, h), pygame.SRCALPHA).convert_alpha()
+        else:
+            column = pygame.Surface((1, h)).convert()
+        for y in range(h):
+            column.set_at((0, y), color_at(y / h))
+        surf = pygame.transform.scale(column, (w, h))
+        return surf.convert_alpha() if has_alpha else surf.convert()
+
+    def _linear_gradient(self, size, top, bottom):
+        """Cached top-to-bottom gradient between two RGB(A) colors; kept across font rebuilds"""
+        key = (size, top, bottom)
+        surf = self._gradient_cache.get(key)
+        if surf is None:
+            surf = self._gradient_cache[key] = self._vgradient(
+                size, lambda p: tuple(int(a + (b - a) * p) for a, b in zip(top, bottom)))
+        return surf
+
+    def _build_dashboard_bg(self):
+        """Pre-render the home screen's static chrome once per font rebuild"""
+        # Smooth gradient background
+        bg = self._linear_gradient((SCREEN_WIDTH, SCREEN_HEIGHT), (18, 22, 35), (12, 18, 27)).copy()
+
+        # Weather glass card
+        clock_x = 40
+        weather_y = 38 + 72 + 38
+        weather_w, weather_h = 280, 42
+        weather_card = pygame.Surface((weather_w, weather_h), pygame.SRCALPHA)
+        weather_card.fill((30, 40, 60, 150))
+        bg.blit(weather_card, (clock_x, weather_y))
+        pygame.draw.rect(bg, (60, 80, 120, 100), (clock_x, weather_y, weather_w, weather_h), width=1, border_radius=8)
+
+        # System panel glass, header and uptime badge (border pulses, drawn per frame)
+        panel_x, panel_y, panel_w, panel_h = 480, 38, 305, 155
+        bg.blit(self._linear_gradient((panel_w, panel_h), (25, 35, 55, 180), (25, 35, 55, 140)),
+                (panel_x, panel_y))
+        bg.blit(self._text("SYSTEM STATUS", 'status', (120, 150, 200)), (panel_x + 15, panel_y + 10))
+        pygame.draw.rect(bg, (40, 55, 80), (panel_x + panel_w - 80, panel_y + 8, 68, 20), border_radius=10)
+
+        # Status tile backgrounds
+        tiles_y, tile_w, tile_h, tile_gap = 210, 186, 75, 9
+        tile_surf = self._linear_gradient((tile_w, tile_h), (25, 32, 48, 160), (35, 40, 60, 130))
+        for i in range(4):
+            x = 15 + (tile_w + tile_gap) * i
+            bg.blit(tile_surf, (x, tiles_y))
+            pygame.draw.rect(bg, (55, 70, 100), (x, tiles_y, tile_w, tile_h), width=1, border_radius=10)
+
+        # Bottom panels: Top Tasks + Active Projects
+        panel_y = tiles_y + tile_h + 12
+        panel_h = SCREEN_HEIGHT - panel_y - 35
+        panel_gap = 12
+        panel_w = (SCREEN_WIDTH - 30 - panel_gap) // 2
+        left_x = 15
+        right_x = left_x + panel_w + panel_gap
+        for px, fill, border, accent, title, title_color in (
+                (left_x, (25, 35, 55), (60, 80, 120), (255, 180, 80), "TOP TASKS", (255, 200, 120)),
+                (right_x, (25, 40, 50), (60, 100, 100), (80, 200, 140), "ACTIVE PROJECTS", (120, 220, 170))):
+            bg.blit(self._linear_gradient((panel_w, panel_h), (*fill, 180), (*fill, 200)), (px, panel_y))
+            pygame.draw.rect(bg, border, (px, panel_y, panel_w, panel_h), width=1, border_radius=10)
+            pygame.draw.rect(bg, accent, (px + 12, panel_y + 10, 3, 14), border_radius=1)
+            bg.blit(self._text(title, 'status', title_color), (px + 22, panel_y + 10))
+
+        # Footer - simple navigation hints
+        hint_surf = self._text("T Tasks  C Chat  K Kanban  G Gateway", 'status', (80, 90, 115))
+        bg.blit(hint_surf, ((SCREEN_WIDTH - hint_surf.get_width())//2, SCREEN_HEIGHT - 18))
+
+        self._dashboard_bg = bg
+        self._dash_layer = None
+        self._dash_layer_key = None  # Forces _dashboard_layer to rebuild on top of the new bg
+
+    def _dashboard_layer(self, day_name, date_str, stats):
+        """Static chrome plus slow-changing home content, redrawn only when it changes"""
+        # Top tasks rows: (priority color, name, due)
+        try:
+            # Due/today tasks first, then fill from the top; ids avoid dict-equality scans
+            urgent_tasks = []
+            seen = set()
+            head = self.tasks[:8] if self.tasks else []
+            for task in head:
+                if task.get('due') or 'today' in str(task.get('labels', [])).lower():
+                    urgent_tasks.append(task)
+                    seen.add(id(task))
+                    if len(urgent_tasks) == 4:
+                        break
+            if len(urgent_tasks) < 4:
+                for task in head:
+                    if id(task) not in seen:
+                        urgent_tasks.append(task)
+                        seen.add(id(task))
+                        if len(urgent_tasks) == 4:
+                            break
+
+            task_rows = []
+            for task in urgent_tasks:
+                p = task.get('priority', 1)
+                p_color = (255, 90, 90) if p >= 4 else (255, 180, 80) if p >= 3 else (100, 180, 255)
+                name = task.get('content', '')[:28]
+                if len(task.get('content', '')) > 28:
+                    name += '...'
+                due = ''
+                due_val = task.get('due')
+                if due_val:
+                    if isinstance(due_val, dict):
+                        due = due_val.get('string', '')[:10]
+                    else:
+                        due = str(due_val)[:10]
+                task_rows.append((p_color, name, due))
+            task_rows = tuple(task_rows)
+        except Exception:
+            task_rows = None
+
+        # Active project rows: (column color, title, priority color)
+        try:
+            if not hasattr(self, 'kanban_data') or not self.kanban_data:
+                self._load_kanban_data()
+            project_rows = []
+            for col in ['Active', 'Stuck']:
+                for card in self.kanban_data.get(col, [])[:3]:
+                    if len(project_rows) == 4:
+                        break
+                    col_color = (60, 180, 100) if col == 'Active' else (200, 70, 70)
+                    title = card.get('title', '')[:26]
+                    if len(card.get('title', '')) > 26:
+                        title += '...'
+                    priority = card.get('priority', '🟡')
+                    p_color = (255, 90, 90) if priority in ['🔴', 'red'] else (255, 200, 80) if priority in ['🟡', 'yellow'] else (100, 200, 130)
+                    project_rows.append((col_color, title, p_color))
+            project_rows = tuple(project_rows)
+        except Exception:
+            project_rows = None
+
+        key = (day_name, date_str, self.weather, stats['uptime'], task_rows, project_rows)
+        if key == self._dash_layer_key:
+            return self._dash_layer
+
+        layer = self._dashboard_bg.copy()
+        clock_x = 40
+        date_y = 38 + 72
+
+        # Day name - larger
+        day_surf = self._text(day_name, 'title', (220, 230, 255))
+        layer.blit(day_surf, (clock_x, date_y))
+
+        # Decorative line
+        line_x = clock_x + day_surf.get_width() + 12
+        pygame.draw.line(layer, (60, 80, 120), (line_x, date_y + 8), (line_x, date_y + 22), 2)
+
+        # Full date
+        layer.blit(self._text(date_str, 'msg', (140, 160, 200)), (line_x + 12, date_y + 6))
+
+        # Weather card
+        weather_y = date_y + 38
+        if self.weather:
+            weather_lower = self.weather.lower()
+            if 'sun' in weather_lower or 'clear' in weather_lower:
+                w_color = (255, 200, 80)
+            elif 'cloud' in weather_lower:
+                w_color = (180, 195, 220)
+            elif 'rain' in weather_lower:
+                w_color = (100, 160, 230)
+            else:
+                w_color = (160, 175, 200)
+
+            # Weather icon circle
+            pygame.draw.circle(layer, (40, 50, 70), (clock_x + 24, weather_y + 21), 14)
+            pygame.draw.circle(layer, w_color, (clock_x + 24, weather_y + 21), 10)
+
+            # Weather text
+            layer.blit(self._text(self.weather[:32], 'msg', (200, 215, 240)), (clock_x + 48, weather_y + 12))
+        else:
+            layer.blit(self._text("Loading weather...", 'status', (100, 120, 150)), (clock_x + 15, weather_y + 14))
+
+        # Uptime badge text
+        up_badge_x = 480 + 305 - 80
+        up_surf = self._text(stats['uptime'], 'status', (140, 180, 230))
+        layer.blit(up_surf, (up_badge_x + 34 - up_surf.get_width() // 2, 38 + 11))
+
+        # Bottom panels
+        panel_y = 210 + 75 + 12
+        panel_gap = 12
+        panel_w = (SCREEN_WIDTH - 30 - panel_gap) // 2
+        left_x = 15
+        right_x = left_x + panel_w + panel_gap
+
+        if task_rows is None:
+            layer.blit(self._text("Loading tasks...", 'msg', (100, 140, 160)), (left_x + 22, panel_y + 50))
+        elif not task_rows:
+            layer.blit(self._text("All clear!", 'msg', (100, 180, 130)), (left_x + 22, panel_y + 50))
+        else:
+            task_y = panel_y + 32
+            for p_color, name, due in task_rows:
+                pygame.draw.circle(layer, p_color, (left_x + 20, task_y + 10), 4)
+                layer.blit(self._text(name, 'msg', (220, 230, 245)), (left_x + 32, task_y + 2))
+                if due:
+                    due_surf = self._text(due, 'status', (120, 140, 170))
+                    layer.blit(due_surf, (left_x + panel_w - due_surf.get_width() - 15, task_y + 4))
+                task_y += 28
+
+        if project_rows is None:
+            layer.blit(self._text("Loading projects...", 'msg', (100, 140, 160)), (right_x + 22, panel_y + 50))
+        elif not project_rows:
+            layer.blit(self._text("No active projects", 'msg', (100, 140, 160)), (right_x + 22, panel_y + 50))
+        else:
+            card_y = panel_y + 32
+            for col_color, title, p_color in project_rows:
+                pygame.draw.rect(layer, col_color, (right_x + 14, card_y + 3, 8, 14), border_radius=2)
+                layer.blit(self._text(title, 'msg', (220, 230, 245)), (right_x + 30, card_y + 2))
+                pygame.draw.circle(layer, p_color, (right_x + panel_w - 20, card_y + 10), 4)
+                card_y += 28
+
+        self._dash_layer, self._dash_layer_key = layer, key
+        return layer
+
+    def _seconds_ring(self, sec, sec_r):
+        """The 60-dot seconds ring with dots up to sec lit (cached per second)"""
+        ring = self._seconds_ring_cache.get((sec, sec_r))
+        if ring is None:
+            c = sec_r + 3
+            ring = pygame.Surface((c * 2, c * 2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(ring, (30, 40, 60), (c, c), sec_r + 2)
+            for i in range(60):
+                if i <= sec:
+                    brightness = 1.0 if i == sec else 0.6
+                    color = (int(100 * brightness), int(180 * brightness), int(255 * brightness))
+                else:
+                    color = (25, 35, 50)
+                x = c + int((sec_r - 1) * _RING_COS[i])
+                y = c + int((sec_r - 1) * _RING_SIN[i])
+                pygame.draw.circle(ring, color, (x, y), 2)
+            pygame.draw.circle(ring, (150, 200, 255), (c, c), 4)
+            self._seconds_ring_cache[(sec, sec_r)] = ring
+        return ring
+
+    def _clock_glow(self, time_str):
+        """Layered blue halo behind the hero clock, rebuilt only when the time string changes"""
+        cached = self._clock_glow_cache
+        if cached and cached[0] == time_str:
+            return cached[1]
+        text = self.fonts['big'].render(time_str, True, (80, 140, 255)).convert_alpha()
+        glow = pygame.Surface((text.get_width() + 16, text.get_height() + 16), pygame.SRCALPHA).convert_alpha()
+        for layer in range(4, 0, -1):
+            text.set_alpha(25 // layer)
+            for dx in range(-layer*2, layer*2+1, layer):
+                for dy in range(-layer*2, layer*2+1, layer):
+                    glow.blit(text, (8 + dx, 8 + dy))
+        self._clock_glow_cache = (time_str, glow)
+        return glow
+
     def draw_dashboard(self):
         """WOW Home Screen v5 - Ultimate Edition"""
         import math
         import random
 
-        # Initialize animation state
-        if not hasattr(self, 'home_anim'):
-            self.home_anim = 0.0
-
-        self.home_anim += 0.025
+        self.home_anim += 0.025 * self._anim_step
         stats = self.get_system_stats()
-        now = datetime.now()
+        self._text_blits = []
+        sec_bucket = int(time.time())
+        if sec_bucket != self._clock_second:
+            now = datetime.now()
+            self._clock_second = sec_bucket
+            self._clock_fields = (now.strftime("%I:%M").lstrip('0'), now.strftime("%p"),
+                                  now.strftime("%A"), now.strftime("%B %d, %Y"),
+                                  now.second, (now.minute % 10) * 60 + now.second)
+        time_str, ampm, day_name, date_str, second, secs_into_cycle = self._clock_fields
 
         # ═══════════════════════════════════════════════════════════════
-        # SMOOTH GRADIENT BACKGROUND
+        # STATIC CHROME + SLOW CONTENT - date, weather, uptime, task/project rows
         # ═══════════════════════════════════════════════════════════════
-        for y in range(SCREEN_HEIGHT):
-            progress = y / SCREEN_HEIGHT
-            cr = int(18 - 6 * progress)
-            cg = int(22 - 4 * progress)
-            cb = int(35 - 8 * progress)
-            pygame.draw.line(self.screen, (cr, cg, cb), (0, y), (SCREEN_WIDTH, y))
+        self.screen.blit(self._dashboard_layer(day_name, date_str, stats), (0, 0))
+        if not self.weather:
+            self.load_weather()
 
         # ═══════════════════════════════════════════════════════════════
         # HERO CLOCK - Massive, centered, glowing
         # ═══════════════════════════════════════════════════════════════
-        time_str = now.strftime("%I:%M").lstrip('0')
-        time_surf = self.fonts['big'].render(time_str, True, (255, 255, 255))
+        time_surf = self._text(time_str, 'big', (255, 255, 255))
         clock_x = 40
         clock_y = 38
 
-        # Multi-layer glow effect
+        # Multi-layer glow effect - composited once per minute, only its alpha pulses
         glow_pulse = 0.7 + 0.3 * math.sin(self.home_anim * 2)
-        for layer in range(4, 0, -1):
-            glow_surf = self.fonts['big'].render(time_str, True, (80, 140, 255))
-            glow_surf.set_alpha(int(25 * glow_pulse / layer))
-            for dx in range(-layer*2, layer*2+1, layer):
-                for dy in range(-layer*2, layer*2+1, layer):
-                    self.screen.blit(glow_surf, (clock_x + dx, clock_y + dy))
+        glow = self._clock_glow(time_str)
+        glow.set_alpha(int(255 * glow_pulse))
+        self.screen.blit(glow, (clock_x - 8, clock_y - 8))
 
         # Main time - crisp white
-        self.screen.blit(time_surf, (clock_x, clock_y))
+        self._text_blits.append((time_surf, (clock_x, clock_y)))
 
         # Animated colon (blinks smoothly)
         colon_x = clock_x + time_surf.get_width() // 2 - 8
         colon_alpha = int(100 + 155 * (0.5 + 0.5 * math.sin(self.home_anim * 4)))
 
         # AM/PM pill badge
-        ampm = now.strftime("%p")
         ampm_x = clock_x + time_surf.get_width() + 15
         ampm_y = clock_y + 25
 
         # Glowing pill
         pill_w, pill_h = 48, 26
-        pill_surf = pygame.Surface((pill_w + 8, pill_h + 8), pygame.SRCALPHA)
-        pygame.draw.rect(pill_surf, (80, 120, 200, 60), (0, 0, pill_w + 8, pill_h + 8), border_radius=13)
+        pill_surf = self._glow_cache.get('pill')
+        if pill_surf is None:
+            pill_surf = pygame.Surface((pill_w + 8, pill_h + 8), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(pill_surf, (80, 120, 200, 60), (0, 0, pill_w + 8, pill_h + 8), border_radius=13)
+            self._glow_cache['pill'] = pill_surf
         self.screen.blit(pill_surf, (ampm_x - 4, ampm_y - 4))
         pygame.draw.rect(self.screen, (40, 60, 100), (ampm_x, ampm_y, pill_w, pill_h), border_radius=13)
         pygame.draw.rect(self.screen, (80, 120, 180), (ampm_x, ampm_y, pill_w, pill_h), width=1, border_radius=13)
-        ampm_surf = self.fonts['msg'].render(ampm, True, (180, 210, 255))
-        self.screen.blit(ampm_surf, (ampm_x + (pill_w - ampm_surf.get_width()) // 2, ampm_y + 5))
+        ampm_surf = self._text(ampm, 'msg', (180, 210, 255))
+        self._text_blits.append((ampm_surf, (ampm_x + (pill_w - ampm_surf.get_width()) // 2, ampm_y + 5)))
 
         # Seconds ring
         sec_x = ampm_x + pill_w + 20
         sec_y = ampm_y + pill_h // 2
         sec_r = 14
-        seconds = now.second + now.microsecond / 1000000
-
-        # Ring background
-        pygame.draw.circle(self.screen, (30, 40, 60), (sec_x, sec_y), sec_r + 2)
 
-        # Progress ring
-        for i in range(60):
-            angle = (i / 60) * 2 * math.pi - math.pi / 2
-            if i <= int(seconds):
-                brightness = 1.0 if i == int(seconds) else 0.6
-                color = (int(100 * brightness), int(180 * brightness), int(255 * brightness))
-            else:
-                color = (25, 35, 50)
-            x = sec_x + int((sec_r - 1) * math.cos(angle))
-            y = sec_y + int((sec_r - 1) * math.sin(angle))
-            pygame.draw.circle(self.screen, color, (x, y), 2)
-
-        # Center dot
-        pygame.draw.circle(self.screen, (150, 200, 255), (sec_x, sec_y), 4)
-
-        # ═══════════════════════════════════════════════════════════════
-        # DATE & WEATHER - Elegant typography
-        # ═══════════════════════════════════════════════════════════════
-        date_y = clock_y + 72
-
-        # Day name - larger
-        day_name = now.strftime("%A")
-        day_surf = self.fonts['title'].render(day_name, True, (220, 230, 255))
-        self.screen.blit(day_surf, (clock_x, date_y))
-
-        # Decorative line
-        line_x = clock_x + day_surf.get_width() + 12
-        pygame.draw.line(self.screen, (60, 80, 120), (line_x, date_y + 8), (line_x, date_y + 22), 2)
-
-        # Full date
-        date_str = now.strftime("%B %d, %Y")
-        date_surf = self.fonts['msg'].render(date_str, True, (140, 160, 200))
-        self.screen.blit(date_surf, (line_x + 12, date_y + 6))
-
-        # Weather card
-        weather_y = date_y + 38
-        weather_w = 280
-        weather_h = 42
-
-        # Glass card effect
-        weather_card = pygame.Surface((weather_w, weather_h), pygame.SRCALPHA)
-        weather_card.fill((30, 40, 60, 150))
-        self.screen.blit(weather_card, (clock_x, weather_y))
-        pygame.draw.rect(self.screen, (60, 80, 120, 100), (clock_x, weather_y, weather_w, weather_h), width=1, border_radius=8)
-
-        if self.weather:
-            weather_lower = self.weather.lower()
-            if 'sun' in weather_lower or 'clear' in weather_lower:
-                w_color = (255, 200, 80)
-                w_icon = "O"
-            elif 'cloud' in weather_lower:
-                w_color = (180, 195, 220)
-                w_icon = "C"
-            elif 'rain' in weather_lower:
-                w_color = (100, 160, 230)
-                w_icon = "R"
-            else:
-                w_color = (160, 175, 200)
-                w_icon = "-"
-
-            # Weather icon circle
-            pygame.draw.circle(self.screen, (40, 50, 70), (clock_x + 24, weather_y + 21), 14)
-            pygame.draw.circle(self.screen, w_color, (clock_x + 24, weather_y + 21), 10)
-
-            # Weather text
-            weather_text = self.weather[:32]
-            w_surf = self.fonts['msg'].render(weather_text, True, (200, 215, 240))
-            self.screen.blit(w_surf, (clock_x + 48, weather_y + 12))
-        else:
-            self.load_weather()
-            loading_surf = self.fonts['status'].render("Loading weather...", True, (100, 120, 150))
-            self.screen.blit(loading_surf, (clock_x + 15, weather_y + 14))
+        # Ring, progress dots and center dot: one pre-rendered surface per whole second
+        ring = self._seconds_ring(second, sec_r)
+        self.screen.blit(ring, (sec_x - ring.get_width() // 2, sec_y - ring.get_height() // 2))
 
         # ═══════════════════════════════════════════════════════════════
         # HEARTBEAT INDICATOR - Beating heart with countdown
@@ -1405,8 +2094,8 @@ class DashboardApp:
 
         # Heart glow (subtle)
         glow_alpha = int(15 + 25 * (scale - 1.0) * 3)
-        glow_surf = pygame.Surface((80, 80), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (180, 60, 80, glow_alpha), (40, 40), int(30 * scale))
+        glow_surf = self._glow_disc((180, 60, 80), int(30 * scale), 40)
+        glow_surf.set_alpha(glow_alpha)
         self.screen.blit(glow_surf, (heart_x - 40, heart_y - 40))
 
         # Draw heart shape (muted color)
@@ -1428,17 +2117,12 @@ class DashboardApp:
         pygame.draw.circle(self.screen, (200, 100, 110), (heart_x - s//3, heart_y - s//3), 2)
 
         # Calculate time to next heartbeat (every 10 min)
-        mins_into_cycle = now.minute % 10
-        secs_into_cycle = mins_into_cycle * 60 + now.second
         next_hb = 10 * 60 - secs_into_cycle
 
-        mins_left = next_hb // 60
-        secs_left = next_hb % 60
-
         # Countdown text
-        countdown_text = f"{mins_left}:{secs_left:02d}"
-        countdown_surf = self.fonts['status'].render(countdown_text, True, (180, 100, 120))
-        self.screen.blit(countdown_surf, (heart_x - countdown_surf.get_width()//2, heart_y + 28))
+        countdown_text = _countdown(next_hb)
+        countdown_surf = self._text(countdown_text, 'status', (180, 100, 120))
+        self._text_blits.append((countdown_surf, (heart_x - countdown_surf.get_width()//2, heart_y + 28)))
 
         # ═══════════════════════════════════════════════════════════════
         # SYSTEM PANEL - Modern glass morphism
@@ -1448,29 +2132,11 @@ class DashboardApp:
         panel_w = 305
         panel_h = 155
 
-        # Glass panel with blur effect simulation
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        # Gradient fill
-        for y in range(panel_h):
-            alpha = 180 - int(40 * y / panel_h)
-            pygame.draw.line(panel_surf, (25, 35, 55, alpha), (0, y), (panel_w, y))
-        self.screen.blit(panel_surf, (panel_x, panel_y))
-
         # Glowing border
         border_pulse = 0.6 + 0.4 * math.sin(self.home_anim * 1.5)
         border_color = (int(60 * border_pulse + 40), int(80 * border_pulse + 50), int(140 * border_pulse + 60))
         pygame.draw.rect(self.screen, border_color, (panel_x, panel_y, panel_w, panel_h), width=1, border_radius=12)
 
-        # Section header
-        header_surf = self.fonts['status'].render("SYSTEM STATUS", True, (120, 150, 200))
-        self.screen.blit(header_surf, (panel_x + 15, panel_y + 10))
-
-        # Uptime badge
-        up_badge_x = panel_x + panel_w - 80
-        pygame.draw.rect(self.screen, (40, 55, 80), (up_badge_x, panel_y + 8, 68, 20), border_radius=10)
-        up_surf = self.fonts['status'].render(stats['uptime'], True, (140, 180, 230))
-        self.screen.blit(up_surf, (up_badge_x + 34 - up_surf.get_width() // 2, panel_y + 11))
-
         # All three gauges same size, evenly spaced
         gauge_r = 34
         gauge_y = panel_y + 85
@@ -1491,7 +2157,7 @@ class DashboardApp:
         temp_cx = panel_x + 55 + gauge_spacing * 2
         temp_pct = int(min(temp_c, 85) / 85 * 100)
         temp_color = (100, 220, 160) if temp_c < 55 else (240, 200, 80) if temp_c < 70 else (240, 100, 100)
-        self._draw_premium_gauge(temp_cx, gauge_y, gauge_r, temp_pct, "TEMP", temp_color, show_val=f"{temp_c}C")
+        self._draw_premium_gauge(temp_cx, gauge_y, gauge_r, temp_pct, "TEMP", temp_color, show_val=_temp_c(temp_c))
 
         # ═══════════════════════════════════════════════════════════════
         # STATUS TILES - 2x2 Grid with icons
@@ -1503,7 +2169,7 @@ class DashboardApp:
 
         gw_status = self._get_gateway_status()
         gw_connected = gw_status.get('connected', False)
-        task_count = len([t for t in self.tasks if not t.get('done')]) if self.tasks else 0
+        task_count = self._pending_count
 
         # Tile 1: Gateway
         self._draw_status_tile(15, tiles_y, tile_w, tile_h,
@@ -1513,167 +2179,53 @@ class DashboardApp:
 
         # Tile 2: Tasks
         self._draw_status_tile(15 + tile_w + tile_gap, tiles_y, tile_w, tile_h,
-                              "TASKS", f"{task_count} pending" if task_count else "All done",
+                              "TASKS", _count_label(task_count, "pending") if task_count else "All done",
                               (240, 190, 80) if task_count > 5 else (80, 220, 140) if task_count == 0 else (140, 180, 220),
                               "T", task_count == 0)
 
         # Tile 3: Kanban
-        kanban_count = sum(len(cards) for cards in getattr(self, 'kanban_data', {}).values())
+        kanban_count = self._kanban_card_count
         self._draw_status_tile(15 + (tile_w + tile_gap) * 2, tiles_y, tile_w, tile_h,
-                              "KANBAN", f"{kanban_count} projects",
+                              "KANBAN", _count_label(kanban_count, "projects"),
                               (140, 120, 220),
                               "K", True)
 
         # Tile 4: Chat
         msg_count = len(self.messages) if self.messages else 0
         self._draw_status_tile(15 + (tile_w + tile_gap) * 3, tiles_y, tile_w, tile_h,
-                              "CHAT", f"{msg_count} messages" if msg_count else "Start chat",
+                              "CHAT", _count_label(msg_count, "messages") if msg_count else "Start chat",
                               (100, 160, 240),
                               "C", True)
 
-        # ═══════════════════════════════════════════════════════════════
-        # BOTTOM PANELS - Tasks + Active Projects side by side
-        # ═══════════════════════════════════════════════════════════════
-        panel_y = tiles_y + tile_h + 12
-        panel_h = SCREEN_HEIGHT - panel_y - 35
-        panel_gap = 12
-        panel_w = (SCREEN_WIDTH - 30 - panel_gap) // 2
-
-        # ─────────────────────────────────────────────────────────────
-        # LEFT PANEL: Top Tasks
-        # ─────────────────────────────────────────────────────────────
-        left_x = 15
-
-        # Panel background with subtle gradient
-        panel_surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        for py in range(panel_h):
-            alpha = 180 + int(20 * (py / panel_h))
-            panel_surf.fill((25, 35, 55, alpha), (0, py, panel_w, 1))
-        self.screen.blit(panel_surf, (left_x, panel_y))
-        pygame.draw.rect(self.screen, (60, 80, 120), (left_x, panel_y, panel_w, panel_h), width=1, border_radius=10)
-
-        # Header with accent
-        pygame.draw.rect(self.screen, (255, 180, 80), (left_x + 12, panel_y + 10, 3, 14), border_radius=1)
-        title_surf = self.fonts['status'].render("TOP TASKS", True, (255, 200, 120))
-        self.screen.blit(title_surf, (left_x + 22, panel_y + 10))
-
-        # Get urgent tasks (with error handling)
-        try:
-            urgent_tasks = []
-            tasks_list = self.tasks if self.tasks else []
-            for task in tasks_list[:8]:
-                if task.get('due') or 'today' in str(task.get('labels', [])).lower():
-                    urgent_tasks.append(task)
-            if len(urgent_tasks) < 4:
-                for task in tasks_list[:8]:
-                    if task not in urgent_tasks:
-                        urgent_tasks.append(task)
-                    if len(urgent_tasks) >= 4:
-                        break
-
-            task_y = panel_y + 32
-            for i, task in enumerate(urgent_tasks[:4]):
-                # Priority indicator
-                p = task.get('priority', 1)
-                p_color = (255, 90, 90) if p >= 4 else (255, 180, 80) if p >= 3 else (100, 180, 255)
-                pygame.draw.circle(self.screen, p_color, (left_x + 20, task_y + 10), 4)
-
-                # Task name
-                name = task.get('content', '')[:28]
-                if len(task.get('content', '')) > 28:
-                    name += '...'
-                name_surf = self.fonts['msg'].render(name, True, (220, 230, 245))
-                self.screen.blit(name_surf, (left_x + 32, task_y + 2))
-
-                # Due date if exists
-                due_val = task.get('due')
-                if due_val:
-                    if isinstance(due_val, dict):
-                        due = due_val.get('string', '')[:10]
-                    else:
-                        due = str(due_val)[:10]
-                    due_surf = self.fonts['status'].render(due, True, (120, 140, 170))
-                    self.screen.blit(due_surf, (left_x + panel_w - due_surf.get_width() - 15, task_y + 4))
-
-                task_y += 28
-
-            if not urgent_tasks:
-                empty_surf = self.fonts['msg'].render("All clear!", True, (100, 180, 130))
-                self.screen.blit(empty_surf, (left_x + 22, panel_y + 50))
-        except Exception:
-            empty_surf = self.fonts['msg'].render("Loading tasks...", True, (100, 140, 160))
-            self.screen.blit(empty_surf, (left_x + 22, panel_y + 50))
-
-        # ─────────────────────────────────────────────────────────────
-        # RIGHT PANEL: Active Projects
-        # ─────────────────────────────────────────────────────────────
-        right_x = left_x + panel_w + panel_gap
-
-        # Panel background
-        panel_surf2 = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
-        for py in range(panel_h):
-            alpha = 180 + int(20 * (py / panel_h))
-            panel_surf2.fill((25, 40, 50, alpha), (0, py, panel_w, 1))
-        self.screen.blit(panel_surf2, (right_x, panel_y))
-        pygame.draw.rect(self.screen, (60, 100, 100), (right_x, panel_y, panel_w, panel_h), width=1, border_radius=10)
-
-        # Header
-        pygame.draw.rect(self.screen, (80, 200, 140), (right_x + 12, panel_y + 10, 3, 14), border_radius=1)
-        title_surf2 = self.fonts['status'].render("ACTIVE PROJECTS", True, (120, 220, 170))
-        self.screen.blit(title_surf2, (right_x + 22, panel_y + 10))
-
-        # Get active kanban cards (with error handling)
-        try:
-            if not hasattr(self, 'kanban_data') or not self.kanban_data:
-                self._load_kanban_data()
-            active_cards = []
-            for col in ['Active', 'Stuck']:
-                for card in self.kanban_data.get(col, [])[:3]:
-                    active_cards.append((col, card))
-
-            card_y = panel_y + 32
-            for col_name, card in active_cards[:4]:
-                # Column indicator
-                col_color = (60, 180, 100) if col_name == 'Active' else (200, 70, 70)
-                pygame.draw.rect(self.screen, col_color, (right_x + 14, card_y + 3, 8, 14), border_radius=2)
-
-                # Card title
-                title = card.get('title', '')[:26]
-                if len(card.get('title', '')) > 26:
-                    title += '...'
-                title_surf = self.fonts['msg'].render(title, True, (220, 230, 245))
-                self.screen.blit(title_surf, (right_x + 30, card_y + 2))
-
-                # Priority dot
-                priority = card.get('priority', '🟡')
-                p_color = (255, 90, 90) if priority in ['🔴', 'red'] else (255, 200, 80) if priority in ['🟡', 'yellow'] else (100, 200, 130)
-                pygame.draw.circle(self.screen, p_color, (right_x + panel_w - 20, card_y + 10), 4)
-
-                card_y += 28
-
-            if not active_cards:
-                empty_surf = self.fonts['msg'].render("No active projects", True, (100, 140, 160))
-                self.screen.blit(empty_surf, (right_x + 22, panel_y + 50))
-        except Exception:
-            empty_surf = self.fonts['msg'].render("Loading projects...", True, (100, 140, 160))
-            self.screen.blit(empty_surf, (right_x + 22, panel_y + 50))
-
-        # ═══════════════════════════════════════════════════════════════
-        # FOOTER - Simple navigation hints
-        # ═══════════════════════════════════════════════════════════════
-        hint = "T Tasks  C Chat  K Kanban  G Gateway"
-        hint_surf = self.fonts['status'].render(hint, True, (80, 90, 115))
-        self.screen.blit(hint_surf, ((SCREEN_WIDTH - hint_surf.get_width())//2, SCREEN_HEIGHT - 18))
+        # Text always sits on top of the shapes above, so draw it last in one batch
+        self._flush_text()
+
+        # The whole frame is composed every time, but unless the slow layer or a tile/gauge value
+        # changed, only the pulsing regions need to reach the display
+        state = (id(self._dash_layer), time_str, gw_connected, task_count, kanban_count, msg_count,
+                 stats['cpu'], stats['mem'], stats['temp'])
+        unchanged = state == getattr(self, '_dash_state', None)
+        self._dash_state = state
+        if unchanged:
+            clock_rect = pygame.Rect(clock_x - 8, clock_y - 8, glow.get_width(), glow.get_height())
+            self._dirty = [
+                clock_rect.union(pygame.Rect(sec_x - ring.get_width() // 2, sec_y - ring.get_height() // 2,
+                                             ring.get_width(), ring.get_height())),
+                pygame.Rect(heart_x - 45, heart_y - 40, 90, 90),           # Heart and countdown
+                pygame.Rect(panel_x, panel_y, panel_w + 1, panel_h + 1),   # Border pulse
+                pygame.Rect(15, tiles_y, SCREEN_WIDTH - 30, tile_h),       # Tile icon glows
+            ]
 
     def _draw_premium_gauge(self, cx, cy, r, pct, label, color, show_val=None):
         """Draw a premium circular gauge with glow"""
-        import math
-
-        # Outer glow
-        glow_surf = pygame.Surface((r*2 + 20, r*2 + 20), pygame.SRCALPHA)
-        for i in range(3):
-            pygame.draw.circle(glow_surf, (color[0]//4, color[1]//4, color[2]//4, 30 - i*10),
-                             (r + 10, r + 10), r + 5 - i*2)
+        # Outer glow - static per radius and color
+        glow_surf = self._glow_cache.get(('gauge', r, color))
+        if glow_surf is None:
+            glow_surf = pygame.Surface((r*2 + 20, r*2 + 20), pygame.SRCALPHA).convert_alpha()
+            for i in range(3):
+                pygame.draw.circle(glow_surf, (color[0]//4, color[1]//4, color[2]//4, 30 - i*10),
+                                 (r + 10, r + 10), r + 5 - i*2)
+            self._glow_cache[('gauge', r, color)] = glow_surf
         self.screen.blit(glow_surf, (cx - r - 10, cy - r - 10))
 
         # Background
@@ -1683,49 +2235,46 @@ class DashboardApp:
         # Track
         pygame.draw.circle(self.screen, (35, 45, 65), (cx, cy), r - 6, width=4)
 
-        # Progress arc with gradient
+        # Progress arc with gradient - rasterized once per value, then just blitted
         if pct > 0:
-            for i in range(int(pct)):
-                angle = -math.pi/2 + (i/100) * 2 * math.pi
-                progress = i / max(pct, 1)
-
-                # Color intensity increases along arc
-                intensity = 0.5 + 0.5 * progress
-                c = (int(color[0] * intensity), int(color[1] * intensity), int(color[2] * intensity))
-
-                inner_r = r - 9
-                outer_r = r - 4
-                x1 = cx + int(inner_r * math.cos(angle))
-                y1 = cy + int(inner_r * math.sin(angle))
-                x2 = cx + int(outer_r * math.cos(angle))
-                y2 = cy + int(outer_r * math.sin(angle))
-                pygame.draw.line(self.screen, c, (x1, y1), (x2, y2), 3)
+            key = (r, pct, color)
+            arc = self._gauge_arc_cache.get(key)
+            if arc is None:
+                arc = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA).convert_alpha()
+                # Endpoints are shared by every gauge of this radius; only the color ramps with pct
+                step = 0.5 / max(pct, 1)
+                cr, cg, cb = color
+                for i, (p1, p2) in enumerate(islice(_gauge_arc_points(r), int(pct))):
+                    # Color intensity increases along arc
+                    intensity = 0.5 + step * i
+                    pygame.draw.line(arc, (int(cr * intensity), int(cg * intensity), int(cb * intensity)), p1, p2, 3)
+                self._gauge_arc_cache[key] = arc
+            self.screen.blit(arc, (cx - r, cy - r))
 
         # Center value - use show_val if provided, otherwise show percentage
-        display_val = show_val if show_val else f"{pct}%"
-        pct_surf = self.fonts['msg'].render(display_val, True, color)
-        self.screen.blit(pct_surf, (cx - pct_surf.get_width()//2, cy - 8))
+        display_val = show_val if show_val else _pct(pct)
+        pct_surf = self._text(display_val, 'msg', color)
+        self._text_blits.append((pct_surf, (cx - pct_surf.get_width()//2, cy - 8)))
 
         # Label
-        label_surf = self.fonts['status'].render(label, True, (110, 130, 170))
-        self.screen.blit(label_surf, (cx - label_surf.get_width()//2, cy + r + 8))
+        label_surf = self._text(label, 'status', (110, 130, 170))
+        self._text_blits.append((label_surf, (cx - label_surf.get_width()//2, cy + r + 8)))
+
+    def _glow_disc(self, rgb, radius, half):
+        """Opaque disc on a transparent (2*half)^2 surface; callers pulse it with set_alpha"""
+        key = ('disc', rgb, radius, half)
+        surf = self._glow_cache.get(key)
+        if surf is None:
+            surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(surf, rgb, (half, half), radius)
+            self._glow_cache[key] = surf
+        return surf
 
     def _draw_status_tile(self, x, y, w, h, title, value, color, icon_char, is_good):
         """Draw a modern status tile"""
         import math
 
-        # Tile background with gradient
-        tile_surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        for i in range(h):
-            alpha = 160 - int(30 * i / h)
-            r = 25 + int(10 * i / h)
-            g = 32 + int(8 * i / h)
-            b = 48 + int(12 * i / h)
-            pygame.draw.line(tile_surf, (r, g, b, alpha), (0, i), (w, i))
-        self.screen.blit(tile_surf, (x, y))
-
-        # Border
-        pygame.draw.rect(self.screen, (55, 70, 100), (x, y, w, h), width=1, border_radius=10)
+        # Background and border come from _build_dashboard_bg
 
         # Accent line at top
         pygame.draw.rect(self.screen, color, (x + 10, y, w - 20, 2), border_radius=1)
@@ -1738,9 +2287,8 @@ class DashboardApp:
         glow_r = int(18 + 4 * pulse)
 
         # Glow
-        glow_surf = pygame.Surface((glow_r * 2 + 10, glow_r * 2 + 10), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (color[0]//3, color[1]//3, color[2]//3, int(60 * pulse)),
-                          (glow_r + 5, glow_r + 5), glow_r)
+        glow_surf = self._glow_disc((color[0]//3, color[1]//3, color[2]//3), glow_r, glow_r + 5)
+        glow_surf.set_alpha(int(60 * pulse))
         self.screen.blit(glow_surf, (icon_x - glow_r - 5, icon_y - glow_r - 5))
 
         # Icon background
@@ -1748,8 +2296,8 @@ class DashboardApp:
         pygame.draw.circle(self.screen, color, (icon_x, icon_y), 16, width=2)
 
         # Icon letter
-        icon_surf = self.fonts['msg'].render(icon_char, True, color)
-        self.screen.blit(icon_surf, (icon_x - icon_surf.get_width()//2, icon_y - icon_surf.get_height()//2))
+        icon_surf = self._text(icon_char, 'msg', color)
+        self._text_blits.append((icon_surf, (icon_x - icon_surf.get_width()//2, icon_y - icon_surf.get_height()//2)))
 
         # Status indicator
         if is_good:
@@ -1761,12 +2309,29 @@ class DashboardApp:
                              (x + w - 18, y + 14), 5)
 
         # Title
-        title_surf = self.fonts['status'].render(title, True, (110, 130, 170))
-        self.screen.blit(title_surf, (x + 52, y + 15))
+        title_surf = self._text(title, 'status', (110, 130, 170))
+        self._text_blits.append((title_surf, (x + 52, y + 15)))
 
         # Value
-        value_surf = self.fonts['msg'].render(value, True, (210, 225, 250))
-        self.screen.blit(value_surf, (x + 52, y + 38))
+        value_surf = self._text(value, 'msg', (210, 225, 250))
+        self._text_blits.append((value_surf, (x + 52, y + 38)))
+
+    def _tasks_bg_column(self, idx):
+        """1px-wide tasks background gradient at wave phase idx/32 (built on first use)"""
+        column = self._tasks_bg_cols[idx]
+        if column is None:
+            import math
+            h = SCREEN_HEIGHT - 36
+            column = pygame.Surface((1, h)).convert()
+            for y in range(h):
+                progress = y / h
+                wave = math.sin(idx / 32 * 2 * math.pi + progress * 2) * 3
+                r = int(18 + wave)
+                g = int(20 + wave)
+                b = int(28 + progress * 8 + wave)
+                column.set_at((0, y), (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b))))
+            self._tasks_bg_cols[idx] = column
+        return column
 
     def draw_tasks(self):
         """WOW Edition - Premium animated task interface"""
@@ -1778,18 +2343,17 @@ class DashboardApp:
             self.todoist_sync_status = 'live'
         if not hasattr(self, 'task_filter'):
             self.task_filter = 'all'
-        if not hasattr(self, 'wow_anim_time'):
-            self.wow_anim_time = 0
         if not hasattr(self, 'task_expanded'):
             self.task_expanded = set()
         if not hasattr(self, 'tasks') or self.tasks is None:
             self.tasks = []
 
-        self.wow_anim_time += 0.03  # Animation timer
+        self.wow_anim_time += 0.03 * self._anim_step  # Animation timer
+        self._text_blits = []
 
         # Auto-refresh every 30 seconds
         if time.time() - self.todoist_last_sync > 30:
-            self._load_todoist_tasks()
+            self._refresh_tasks_async()
 
         # Filter tasks
         all_tasks = self.tasks
@@ -1816,14 +2380,13 @@ class DashboardApp:
         # ═══════════════════════════════════════════════════════════════
         # BACKGROUND - Animated gradient
         # ═══════════════════════════════════════════════════════════════
-        # Dark base with subtle animated gradient
-        for y in range(36, SCREEN_HEIGHT):
-            progress = (y - 36) / (SCREEN_HEIGHT - 36)
-            wave = math.sin(self.wow_anim_time * 0.5 + progress * 2) * 3
-            r = int(18 + wave)
-            g = int(20 + wave)
-            b = int(28 + progress * 8 + wave)
-            pygame.draw.line(self.screen, (max(0,min(255,r)), max(0,min(255,g)), max(0,min(255,b))), (0, y), (SCREEN_WIDTH, y))
+        # Dark base with subtle animated gradient - the wave is periodic, so one of 32
+        # pre-rendered 1px phase columns is stretched straight into the screen
+        phase = (self.wow_anim_time * 0.5) % (2 * math.pi)
+        column = self._tasks_bg_column(int(phase / (2 * math.pi) * 32) % 32)
+        if getattr(self, '_tasks_bg_dest', None) is None:
+            self._tasks_bg_dest = self.screen.subsurface((0, 36, SCREEN_WIDTH, SCREEN_HEIGHT - 36))
+        pygame.transform.scale(column, self._tasks_bg_dest.get_size(), self._tasks_bg_dest)
 
         # ═══════════════════════════════════════════════════════════════
         # LEFT SIDEBAR - Project cards with progress rings (180px)
@@ -1867,19 +2430,18 @@ class DashboardApp:
             # Colored accent bar on left
             bar_height = card_h - 16
             bar_y = card_y + 8
-            accent_alpha = 255 if is_active else 140
-            pygame.draw.rect(self.screen, (*color[:3], accent_alpha) if is_active else (color[0]//2, color[1]//2, color[2]//2),
-                           (sidebar_x + 12, bar_y, 4, bar_height), border_radius=2)
+            bar_color = tuple(color[:3]) if is_active else (color[0]//2, color[1]//2, color[2]//2)
+            self._text_blits.append((self._bar(bar_color, 4, bar_height), (sidebar_x + 12, bar_y)))
 
             # Project name (left aligned after accent bar)
             name_color = (240, 245, 255) if is_active else (140, 145, 160)
-            name_surf = self.fonts['msg'].render(proj_name, True, name_color)
-            self.screen.blit(name_surf, (sidebar_x + 24, card_y + card_h//2 - name_surf.get_height()//2))
+            name_surf = self._text(proj_name, 'msg', name_color)
+            self._text_blits.append((name_surf, (sidebar_x + 24, card_y + card_h//2 - name_surf.get_height()//2)))
 
             # Count badge on right (pill shape)
             if count > 0:
                 count_text = str(count)
-                count_surf = self.fonts['status'].render(count_text, True, (255, 255, 255) if is_active else (180, 185, 200))
+                count_surf = self._text(count_text, 'status', (255, 255, 255) if is_active else (180, 185, 200))
                 badge_w = max(28, count_surf.get_width() + 14)
                 badge_h = 22
                 badge_x = sidebar_x + sidebar_w - 18 - badge_w
@@ -1890,8 +2452,8 @@ class DashboardApp:
                 pygame.draw.rect(self.screen, badge_color, (badge_x, badge_y, badge_w, badge_h), border_radius=11)
 
                 # Badge text
-                self.screen.blit(count_surf, (badge_x + badge_w//2 - count_surf.get_width()//2,
-                                              badge_y + badge_h//2 - count_surf.get_height()//2))
+                self._text_blits.append((count_surf, (badge_x + badge_w//2 - count_surf.get_width()//2,
+                                                      badge_y + badge_h//2 - count_surf.get_height()//2)))
 
             card_y += card_h + 8
 
@@ -1935,8 +2497,8 @@ class DashboardApp:
             pygame.draw.line(self.screen, (80, 200, 120), (check_x - 12, check_y + 2), (check_x - 2, check_y + 12), 4)
             pygame.draw.line(self.screen, (80, 200, 120), (check_x - 2, check_y + 12), (check_x + 14, check_y - 8), 4)
 
-            msg_surf = self.fonts['title'].render("All clear!", True, (200, 205, 220))
-            self.screen.blit(msg_surf, (check_x - msg_surf.get_width()//2, int(card_y_pos + 95)))
+            msg_surf = self._text("All clear!", 'title', (200, 205, 220))
+            self._text_blits.append((msg_surf, (check_x - msg_surf.get_width()//2, int(card_y_pos + 95))))
         else:
             # Scroll handling
             if self.task_selected >= len(display_list):
@@ -1972,13 +2534,12 @@ class DashboardApp:
                 badge_labels = {4: 'URGENT', 3: 'HIGH', 2: 'MEDIUM', 1: ''}
                 if priority > 1:
                     badge_text = badge_labels[priority]
-                    badge_surf = self.fonts['status'].render(badge_text, True, (255, 255, 255))
+                    badge_surf = self._text(badge_text, 'status', (255, 255, 255))
                     badge_w = badge_surf.get_width() + 16
                     pygame.draw.rect(self.screen, p_color, (main_x + main_w - badge_w - 12, focus_y + 12, badge_w, 22), border_radius=11)
-                    self.screen.blit(badge_surf, (main_x + main_w - badge_w - 4, focus_y + 15))
+                    self._text_blits.append((badge_surf, (main_x + main_w - badge_w - 4, focus_y + 15)))
 
                 # Task title - large (or edit box if editing)
-                title_font = self.fonts['menu_title']
                 is_editing = getattr(self, 'task_editing', False)
 
                 if getattr(self, 'task_saving', False):
@@ -1998,8 +2559,8 @@ class DashboardApp:
                         pygame.draw.circle(self.screen, color, (x, y), 4)
 
                     # Saving text
-                    save_surf = self.fonts['msg'].render("Saving...", True, (100, 180, 140))
-                    self.screen.blit(save_surf, (spinner_x - save_surf.get_width() // 2, spinner_y + 30))
+                    save_surf = self._text("Saving...", 'msg', (100, 180, 140))
+                    self._text_blits.append((save_surf, (spinner_x - save_surf.get_width() // 2, spinner_y + 30)))
 
                 elif is_editing:
                     # Show editable text with cursor
@@ -2015,48 +2576,48 @@ class DashboardApp:
                     display_text = edit_text[:60]
                     before_cursor = edit_text[:cursor_pos]
 
-                    text_surf = title_font.render(display_text, True, (235, 240, 255))
+                    text_surf = self._text(display_text, 'menu_title', (235, 240, 255))
                     self.screen.blit(text_surf, (main_x + 24, focus_y + 18))
 
                     # Blinking cursor
-                    if int(self.wow_anim_time * 3) % 2 == 0:
-                        cursor_x = main_x + 24 + title_font.size(before_cursor[:60])[0]
+                    if self._cursor_on:
+                        cursor_x = main_x + 24 + self._measure('menu_title', before_cursor[:60])
                         pygame.draw.line(self.screen, (100, 200, 150), (cursor_x, focus_y + 16), (cursor_x, focus_y + 42), 2)
 
                     # Hint
-                    hint_surf = self.fonts['status'].render("Enter to save • Esc to cancel", True, (100, 180, 140))
-                    self.screen.blit(hint_surf, (main_x + 20, focus_y + 55))
+                    hint_surf = self._text("Enter to save • Esc to cancel", 'status', (100, 180, 140))
+                    self._text_blits.append((hint_surf, (main_x + 20, focus_y + 55)))
                 else:
-                    title_text = focus_task.get('content', '')[:65] + ('...' if len(focus_task.get('content', '')) > 65 else '')
-                    title_surf = title_font.render(title_text, True, (235, 240, 255))
-                    self.screen.blit(title_surf, (main_x + 20, focus_y + 18))
+                    title_text = self._truncate_to_px(focus_task.get('content', ''), 'menu_title', main_w - 110)
+                    title_surf = self._text(title_text, 'menu_title', (235, 240, 255))
+                    self._text_blits.append((title_surf, (main_x + 20, focus_y + 18)))
 
                 # Due date with icon
                 due = focus_task.get('due', '')
                 if due:
                     due_color = (255, 100, 100) if 'overdue' in due.lower() else (180, 185, 200)
                     due_icon = '⏰ ' if 'today' in due.lower() else '📅 '
-                    due_surf = self.fonts['msg'].render(due_icon + due, True, due_color)
-                    self.screen.blit(due_surf, (main_x + 20, focus_y + 55))
+                    due_surf = self._text(due_icon + due, 'msg', due_color)
+                    self._text_blits.append((due_surf, (main_x + 20, focus_y + 55)))
 
                 # Description preview
                 desc = focus_task.get('description', '')
                 if desc:
-                    desc_text = desc[:70] + ('...' if len(desc) > 70 else '')
-                    desc_surf = self.fonts['status'].render(desc_text, True, (120, 125, 145))
-                    self.screen.blit(desc_surf, (main_x + 20, focus_y + 80))
+                    desc_text = self._truncate_to_px(desc, 'status', main_w - 40)
+                    desc_surf = self._text(desc_text, 'status', (120, 125, 145))
+                    self._text_blits.append((desc_surf, (main_x + 20, focus_y + 80)))
 
                 # Subtask count
                 subtasks = focus_task.get('subtasks', [])
                 if subtasks:
                     sub_text = f"📋 {len(subtasks)} subtasks"
-                    sub_surf = self.fonts['status'].render(sub_text, True, (130, 170, 220))
-                    self.screen.blit(sub_surf, (main_x + 20, focus_y + 102))
+                    sub_surf = self._text(sub_text, 'status', (130, 170, 220))
+                    self._text_blits.append((sub_surf, (main_x + 20, focus_y + 102)))
 
                 # Recurring indicator
                 if focus_task.get('isRecurring'):
-                    rec_surf = self.fonts['status'].render('🔄 Recurring', True, (140, 200, 160))
-                    self.screen.blit(rec_surf, (main_x + 150, focus_y + 102))
+                    rec_surf = self._text('🔄 Recurring', 'status', (140, 200, 160))
+                    self._text_blits.append((rec_surf, (main_x + 150, focus_y + 102)))
 
             # TASK LIST - Below focus card
             list_y = 190
@@ -2092,7 +2653,7 @@ class DashboardApp:
                     # Subtle highlight
                     pygame.draw.rect(self.screen, (45, 50, 68), (row_x, row_y, row_w, row_h), border_radius=8)
                     # Selection indicator
-                    pygame.draw.rect(self.screen, p_color, (row_x, row_y + 8, 3, row_h - 16), border_radius=2)
+                    self.screen.blit(self._bar(p_color, 3, row_h - 16), (row_x, row_y + 8))
 
                 # Check for subtasks
                 subtasks = task.get('subtasks', [])
@@ -2110,16 +2671,16 @@ class DashboardApp:
                 text_color = (220, 225, 240) if is_selected else (160, 165, 180)
                 max_len = 55 - indent * 5  # Even more room for text
                 display_text = content[:max_len] + ('...' if len(content) > max_len else '')
-                text_surf = self.fonts['msg'].render(display_text, True, text_color)
-                self.screen.blit(text_surf, (cb_x + 18, row_y + row_h//2 - text_surf.get_height()//2))
+                text_surf = self._text(display_text, 'msg', text_color)
+                self._text_blits.append((text_surf, (cb_x + 18, row_y + row_h//2 - text_surf.get_height()//2)))
 
                 # Subtask indicator RIGHT AFTER task name
                 text_end_x = cb_x + 18 + text_surf.get_width() + 6
                 if has_subtasks:
                     chevron_color = (130, 170, 220) if is_selected else (100, 140, 200)
                     sub_text = f"{len(subtasks)}"
-                    sub_surf = self.fonts['status'].render(sub_text, True, chevron_color)
-                    self.screen.blit(sub_surf, (text_end_x, row_y + row_h//2 - sub_surf.get_height()//2))
+                    sub_surf = self._text(sub_text, 'status', chevron_color)
+                    self._text_blits.append((sub_surf, (text_end_x, row_y + row_h//2 - sub_surf.get_height()//2)))
 
                     chev_x = text_end_x + sub_surf.get_width() + 6
                     chev_y = row_y + row_h // 2
@@ -2148,23 +2709,23 @@ class DashboardApp:
                     else:
                         due_text = due[:6]
                     due_bg = (180, 60, 60) if 'overdue' in due.lower() else (50, 55, 70)
-                    due_surf = self.fonts['status'].render(due_text, True, (200, 205, 220))
+                    due_surf = self._text(due_text, 'status', (200, 205, 220))
                     pill_w = due_surf.get_width() + 12
                     pill_x = right_x - pill_w
                     pygame.draw.rect(self.screen, due_bg, (pill_x, row_y + row_h//2 - 10, pill_w, 20), border_radius=10)
-                    self.screen.blit(due_surf, (pill_x + 6, row_y + row_h//2 - due_surf.get_height()//2))
+                    self._text_blits.append((due_surf, (pill_x + 6, row_y + row_h//2 - due_surf.get_height()//2)))
 
                 row_y += row_h
 
             # Scroll indicators with style
             if self.task_scroll > 0:
-                up_surf = self.fonts['status'].render(f"▲ {self.task_scroll} above", True, (100, 140, 220))
-                self.screen.blit(up_surf, (main_x + main_w//2 - up_surf.get_width()//2, list_y - 18))
+                up_surf = self._text(f"▲ {self.task_scroll} above", 'status', (100, 140, 220))
+                self._text_blits.append((up_surf, (main_x + main_w//2 - up_surf.get_width()//2, list_y - 18)))
 
             remaining = len(display_list) - self.task_scroll - max_visible
             if remaining > 0:
-                down_surf = self.fonts['status'].render(f"▼ {remaining} below", True, (100, 140, 220))
-                self.screen.blit(down_surf, (main_x + main_w//2 - down_surf.get_width()//2, row_y + 4))
+                down_surf = self._text(f"▼ {remaining} below", 'status', (100, 140, 220))
+                self._text_blits.append((down_surf, (main_x + main_w//2 - down_surf.get_width()//2, row_y + 4)))
 
         # ═══════════════════════════════════════════════════════════════
         # FOOTER
@@ -2175,20 +2736,34 @@ class DashboardApp:
         sync_status = getattr(self, 'todoist_sync_status', 'live')
         sync_text = "●" if sync_status == 'live' else "◐" if sync_status == 'syncing' else "✗"
         sync_color = (80, 200, 120) if sync_status == 'live' else (220, 180, 60) if sync_status == 'syncing' else (220, 80, 80)
-        sync_surf = self.fonts['status'].render(sync_text, True, sync_color)
-        self.screen.blit(sync_surf, (12, footer_y))
+        sync_surf = self._text(sync_text, 'status', sync_color)
+        self._text_blits.append((sync_surf, (12, footer_y)))
 
         # Hints centered
         if self.task_editing:
             hint = "Enter Save  Esc Cancel"
         else:
             hint = "Space Done  N New  R Sync  1-5 Filter"
-        hint_surf = self.fonts['status'].render(hint, True, (80, 90, 115))
-        self.screen.blit(hint_surf, ((SCREEN_WIDTH - hint_surf.get_width())//2, footer_y))
+        hint_surf = self._text(hint, 'status', (80, 90, 115))
+        self._text_blits.append((hint_surf, ((SCREEN_WIDTH - hint_surf.get_width())//2, footer_y)))
 
+        self._flush_text()
+
+
+    def _commands_view_state(self):
+        """Everything the commands panel draws from, for cheap change detection"""
+        return (self.command_confirm, self.command_running, self.command_result, self.command_selection,
+                getattr(self, 'system_submenu_open', False), getattr(self, 'system_submenu_selection', 0),
+                getattr(self, 'system_submenu_confirm', None))
 
     def draw_commands(self):
         """Draw commands panel with modern card design"""
+        # Panel is static unless its state changes, so unchanged frames need no update
+        state = self._commands_view_state()
+        unchanged = state == getattr(self, '_commands_state', None)
+        self._commands_state = state
+        if unchanged:
+            self._dirty = []
 
         # Show confirmation dialog if active
         if self.command_confirm is not None:
@@ -2198,6 +2773,9 @@ class DashboardApp:
         # Show running indicator if active
         if self.command_running:
             self._draw_command_running()
+            if unchanged:
+                # Only the spinner card animates
+                self._dirty = [pygame.Rect((SCREEN_WIDTH - 350) // 2, (SCREEN_HEIGHT - 120) // 2, 350, 120)]
             return
 
         # Show result if available
@@ -2206,6 +2784,7 @@ class DashboardApp:
             return
 
         commands = self.get_commands()
+        self._text_blits = []
 
         # Layout: 2 columns, 4 rows - fills the screen nicely
         card_w = 380
@@ -2248,18 +2827,18 @@ class DashboardApp:
 
             # Icon letter
             icon = cmd.get('icon', '?')
-            icon_surf = self.fonts['title'].render(icon, True, C['text_bright'])
+            icon_surf = self._text(icon, 'title', C['text_bright'])
             icon_text_x = icon_x - icon_surf.get_width() // 2
             icon_text_y = icon_y - icon_surf.get_height() // 2
-            self.screen.blit(icon_surf, (icon_text_x, icon_text_y))
+            self._text_blits.append((icon_surf, (icon_text_x, icon_text_y)))
 
             # Label - bigger and bolder
-            label_surf = self.fonts['title'].render(cmd['label'], True, C['text_bright'])
-            self.screen.blit(label_surf, (x + 80, y + 18))
+            label_surf = self._text(cmd['label'], 'title', C['text_bright'])
+            self._text_blits.append((label_surf, (x + 80, y + 18)))
 
             # Description
-            desc_surf = self.fonts['msg'].render(cmd['desc'], True, C['text_dim'])
-            self.screen.blit(desc_surf, (x + 80, y + 50))
+            desc_surf = self._text(cmd['desc'], 'msg', C['text_dim'])
+            self._text_blits.append((desc_surf, (x + 80, y + 50)))
 
             # Warning icon on right for non-safe commands
             if category == 'danger':
@@ -2267,15 +2846,18 @@ class DashboardApp:
                 badge_x = x + card_w - 40
                 badge_y = y + card_h // 2
                 pygame.draw.circle(self.screen, C['error'], (badge_x, badge_y), 16)
-                warn_surf = self.fonts['title'].render("!", True, C['text_bright'])
-                self.screen.blit(warn_surf, (badge_x - warn_surf.get_width() // 2, badge_y - warn_surf.get_height() // 2))
+                warn_surf = self._text("!", 'title', C['text_bright'])
+                self._text_blits.append((warn_surf, (badge_x - warn_surf.get_width() // 2, badge_y - warn_surf.get_height() // 2)))
             elif category == 'caution':
                 # Yellow warning
                 badge_x = x + card_w - 40
                 badge_y = y + card_h // 2
                 pygame.draw.circle(self.screen, C['warning'], (badge_x, badge_y), 16)
-                warn_surf = self.fonts['title'].render("!", True, (40, 40, 40))
-                self.screen.blit(warn_surf, (badge_x - warn_surf.get_width() // 2, badge_y - warn_surf.get_height() // 2))
+                warn_surf = self._text("!", 'title', (40, 40, 40))
+                self._text_blits.append((warn_surf, (badge_x - warn_surf.get_width() // 2, badge_y - warn_surf.get_height() // 2)))
+
+        # Card text goes down before any overlay covers it
+        self._flush_text()
 
         # System Submenu overlay
         if getattr(self, 'system_submenu_open', False):
@@ -2287,15 +2869,13 @@ class DashboardApp:
 
         # Footer
         hint = "1-8 Quick  Arrows Nav  Enter Run"
-        hint_surf = self.fonts['status'].render(hint, True, (80, 90, 115))
+        hint_surf = self._text(hint, 'status', (80, 90, 115))
         self.screen.blit(hint_surf, ((SCREEN_WIDTH - hint_surf.get_width())//2, SCREEN_HEIGHT - 18))
 
     def _draw_system_submenu(self):
         """Draw system submenu popup"""
         # Dim background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay(180), (0, 0))
 
         submenu = self.get_system_submenu()
         selection = getattr(self, 'system_submenu_selection', 0)
@@ -2309,7 +2889,7 @@ class DashboardApp:
         pygame.draw.rect(self.screen, C['accent'], (box_x, box_y, box_w, box_h), width=2, border_radius=12)
 
         # Title
-        title_surf = self.fonts['msg'].render("System Tools", True, C['accent'])
+        title_surf = self._text("System Tools", 'msg', C['accent'])
         self.screen.blit(title_surf, (box_x + (box_w - title_surf.get_width()) // 2, box_y + 10))
 
         # Items
@@ -2320,30 +2900,28 @@ class DashboardApp:
             # Highlight selected
             if is_selected:
                 pygame.draw.rect(self.screen, (50, 55, 75), (box_x + 10, item_y - 5, box_w - 20, 38), border_radius=8)
-                pygame.draw.rect(self.screen, C['accent'], (box_x + 10, item_y - 5, 4, 38), border_radius=2)
+                self.screen.blit(self._bar(C['accent'], 4, 38), (box_x + 10, item_y - 5))
 
             # Number
             num_color = C['accent'] if is_selected else (100, 105, 125)
-            num_surf = self.fonts['status'].render(f"[{item['icon']}]", True, num_color)
+            num_surf = self._text(f"[{item['icon']}]", 'status', num_color)
             self.screen.blit(num_surf, (box_x + 20, item_y + 5))
 
             # Label
             label_color = (235, 240, 255) if is_selected else (180, 185, 200)
-            label_surf = self.fonts['msg'].render(item['label'], True, label_color)
+            label_surf = self._text(item['label'], 'msg', label_color)
             self.screen.blit(label_surf, (box_x + 55, item_y + 3))
 
             item_y += 45
 
         # Hint
-        hint_surf = self.fonts['status'].render("1-6 Quick • Arrows • Enter • Esc", True, (100, 105, 125))
+        hint_surf = self._text("1-6 Quick • Arrows • Enter • Esc", 'status', (100, 105, 125))
         self.screen.blit(hint_surf, (box_x + (box_w - hint_surf.get_width()) // 2, box_y + box_h - 25))
 
     def _draw_modern_confirm(self, title, action_name, color, is_danger=False):
         """Draw a modern confirmation dialog"""
         # Dim background with blur effect simulation
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay(220), (0, 0))
 
         # Dialog dimensions
         box_w, box_h = 420, 200
@@ -2369,15 +2947,15 @@ class DashboardApp:
         pygame.draw.circle(self.screen, (color[0]//3, color[1]//3, color[2]//3), (icon_x, icon_y), 28)
         pygame.draw.circle(self.screen, color, (icon_x, icon_y), 24)
         icon_char = "!" if is_danger else "?"
-        icon_surf = self.fonts['menu_title'].render(icon_char, True, (255, 255, 255))
+        icon_surf = self._text(icon_char, 'menu_title', (255, 255, 255))
         self.screen.blit(icon_surf, (icon_x - icon_surf.get_width()//2, icon_y - icon_surf.get_height()//2))
 
         # Title
-        title_surf = self.fonts['title'].render(title, True, C['text_bright'])
+        title_surf = self._text(title, 'title', C['text_bright'])
         self.screen.blit(title_surf, (box_x + (box_w - title_surf.get_width())//2, box_y + 65))
 
         # Action name
-        action_surf = self.fonts['msg'].render(action_name, True, color)
+        action_surf = self._text(action_name, 'msg', color)
         self.screen.blit(action_surf, (box_x + (box_w - action_surf.get_width())//2, box_y + 95))
 
         # Buttons
@@ -2390,17 +2968,17 @@ class DashboardApp:
         cancel_x = box_x + box_w//2 - btn_w - gap//2
         pygame.draw.rect(self.screen, (50, 55, 70), (cancel_x, btn_y, btn_w, btn_h), border_radius=8)
         pygame.draw.rect(self.screen, (80, 85, 100), (cancel_x, btn_y, btn_w, btn_h), width=1, border_radius=8)
-        cancel_surf = self.fonts['msg'].render("Cancel", True, C['text_dim'])
+        cancel_surf = self._text("Cancel", 'msg', C['text_dim'])
         self.screen.blit(cancel_surf, (cancel_x + (btn_w - cancel_surf.get_width())//2, btn_y + 10))
-        esc_surf = self.fonts['status'].render("Esc", True, (100, 105, 120))
+        esc_surf = self._text("Esc", 'status', (100, 105, 120))
         self.screen.blit(esc_surf, (cancel_x + btn_w - 30, btn_y + 12))
 
         # Confirm button
         confirm_x = box_x + box_w//2 + gap//2
         pygame.draw.rect(self.screen, color, (confirm_x, btn_y, btn_w, btn_h), border_radius=8)
-        confirm_surf = self.fonts['msg'].render("Confirm", True, (255, 255, 255))
+        confirm_surf = self._text("Confirm", 'msg', (255, 255, 255))
         self.screen.blit(confirm_surf, (confirm_x + (btn_w - confirm_surf.get_width())//2, btn_y + 10))
-        enter_surf = self.fonts['status'].render("Enter", True, (255, 255, 255, 180))
+        enter_surf = self._text("Enter", 'status', (255, 255, 255, 180))
         self.screen.blit(enter_surf, (confirm_x + btn_w - 38, btn_y + 12))
 
     def _draw_submenu_confirm(self):
@@ -2422,20 +3000,20 @@ class DashboardApp:
 
         # Spinner animation
         spinner_chars = "◐◓◑◒"
-        spinner = spinner_chars[int(time.time() * 4) % 4]
-        spinner_surf = self.fonts['menu_title'].render(spinner, True, C['accent'])
+        spinner = spinner_chars[(pygame.time.get_ticks() // 250) % 4]
+        spinner_surf = self._text(spinner, 'menu_title', C['accent'])
         self.screen.blit(spinner_surf, (x + card_w // 2 - 15, y + 20))
 
         # Running text
         text = f"Running: {self.command_running}"
         if len(text) > 35:
             text = text[:32] + "..."
-        text_surf = self.fonts['msg'].render(text, True, C['text'])
+        text_surf = self._text(text, 'msg', C['text'])
         text_x = x + (card_w - text_surf.get_width()) // 2
         self.screen.blit(text_surf, (text_x, y + 65))
 
         # Please wait
-        wait_surf = self.fonts['status'].render("Please wait...", True, C['text_dim'])
+        wait_surf = self._text("Please wait...", 'status', C['text_dim'])
         wait_x = x + (card_w - wait_surf.get_width()) // 2
         self.screen.blit(wait_surf, (wait_x, y + 92))
 
@@ -2456,8 +3034,8 @@ class DashboardApp:
         # Icon and header
         icon = "✓" if is_success else "✗"
         header = "Success" if is_success else "Error"
-        icon_surf = self.fonts['menu_title'].render(icon, True, border_color)
-        header_surf = self.fonts['title'].render(header, True, border_color)
+        icon_surf = self._text(icon, 'menu_title', border_color)
+        header_surf = self._text(header, 'title', border_color)
         self.screen.blit(icon_surf, (x + card_w // 2 - 60, y + 18))
         self.screen.blit(header_surf, (x + card_w // 2 - 30, y + 20))
 
@@ -2465,13 +3043,13 @@ class DashboardApp:
         msg_lines = [result_msg[i:i+45] for i in range(0, len(result_msg), 45)][:2]
         msg_y = y + 60
         for line in msg_lines:
-            msg_surf = self.fonts['msg'].render(line, True, C['text'])
+            msg_surf = self._text(line, 'msg', C['text'])
             msg_x = x + (card_w - msg_surf.get_width()) // 2
             self.screen.blit(msg_surf, (msg_x, msg_y))
             msg_y += 24
 
         # Hint
-        hint_surf = self.fonts['status'].render("Press any key to continue", True, C['text_muted'])
+        hint_surf = self._text("Press any key to continue", 'status', C['text_muted'])
         hint_x = x + (card_w - hint_surf.get_width()) // 2
         self.screen.blit(hint_surf, (hint_x, y + card_h - 28))
 
@@ -2523,14 +3101,11 @@ class DashboardApp:
                      'Review': 'Review', 'Implement': 'Implement', 'Finished': 'Done'}
 
         # ═══════════════════════════════════════════════════════════════
-        # BACKGROUND
+        # BACKGROUND - static, built once
         # ═══════════════════════════════════════════════════════════════
-        for y in range(36, SCREEN_HEIGHT):
-            progress = (y - 36) / (SCREEN_HEIGHT - 36)
-            r = int(14 + progress * 4)
-            g = int(16 + progress * 4)
-            b = int(22 + progress * 8)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        if getattr(self, '_kanban_bg', None) is None:
+            self._kanban_bg = self._linear_gradient((SCREEN_WIDTH, SCREEN_HEIGHT - 36), (14, 16, 22), (18, 20, 30))
+        self.screen.blit(self._kanban_bg, (0, 36))
 
         # ═══════════════════════════════════════════════════════════════
         # HEADER - Just Salon/Personal tabs (Fast Track is always visible)
@@ -2859,15 +3434,13 @@ class DashboardApp:
         else:
             hint = "Arrows Nav  Space Grab  N New  P Pri  D Del  / Search"
             hint_color = (80, 90, 115)
-        hint_surf = self.fonts['status'].render(hint, True, hint_color)
+        hint_surf = self._text(hint, 'status', hint_color)
         self.screen.blit(hint_surf, ((SCREEN_WIDTH - hint_surf.get_width())//2, footer_y))
 
     def _draw_kanban_search(self):
         """Draw search overlay"""
         # Dim background
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay(180), (0, 0))
 
         # Search box
         box_w, box_h = 400, 50
@@ -2900,14 +3473,12 @@ class DashboardApp:
             result_y += 35
 
         # Hint
-        hint_surf = self.fonts['status'].render("↑↓ Select • Enter Go • Esc Cancel", True, (100, 105, 125))
+        hint_surf = self._text("↑↓ Select • Enter Go • Esc Cancel", 'status', (100, 105, 125))
         self.screen.blit(hint_surf, ((SCREEN_WIDTH - hint_surf.get_width()) // 2, result_y + 15))
 
     def _draw_priority_confirm(self):
         """Draw priority picker - R/Y/G to select"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay(180), (0, 0))
 
         box_w, box_h = 320, 130
         box_x = (SCREEN_WIDTH - box_w) // 2
@@ -2952,14 +3523,12 @@ class DashboardApp:
             self.screen.blit(label_surf, (bx + 40, btn_y + 9))
 
         # Hint
-        hint_surf = self.fonts['status'].render("Press R / Y / G  •  Esc Cancel", True, (120, 125, 145))
+        hint_surf = self._text("Press R / Y / G  •  Esc Cancel", 'status', (120, 125, 145))
         self.screen.blit(hint_surf, (box_x + (box_w - hint_surf.get_width()) // 2, box_y + 105))
 
     def _draw_new_card_form(self):
         """Draw new card input form"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay(200), (0, 0))
 
         box_w, box_h = 550, 280
         box_x = (SCREEN_WIDTH - box_w) // 2
@@ -3054,18 +3623,16 @@ class DashboardApp:
             px += 75
 
         if is_active:
-            arrow_hint = self.fonts['status'].render("<< arrows >>", True, (140, 180, 160))
+            arrow_hint = self._text("<< arrows >>", 'status', (140, 180, 160))
             self.screen.blit(arrow_hint, (px + 10, field_y + 7))
 
         # Hint
-        hint_surf = self.fonts['status'].render("Tab Fields • Arrows Priority • 1/2/3 Quick • Enter Save • Esc Cancel", True, (100, 105, 125))
+        hint_surf = self._text("Tab Fields • Arrows Priority • 1/2/3 Quick • Enter Save • Esc Cancel", 'status', (100, 105, 125))
         self.screen.blit(hint_surf, (box_x + (box_w - hint_surf.get_width()) // 2, box_y + box_h - 22))
 
     def _draw_delete_confirm(self):
         """Draw delete confirmation - must type 'Yes delete my project'"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay(200), (0, 0))
 
         box_w, box_h = 480, 180
         box_x = (SCREEN_WIDTH - box_w) // 2
@@ -3113,7 +3680,7 @@ class DashboardApp:
         self.screen.blit(text_surf, (input_x + 10, input_y + 8))
 
         # Hint
-        hint_surf = self.fonts['status'].render("Enter to confirm • Esc to cancel", True, (120, 100, 100))
+        hint_surf = self._text("Enter to confirm • Esc to cancel", 'status', (120, 100, 100))
         self.screen.blit(hint_surf, (box_x + (box_w - hint_surf.get_width()) // 2, box_y + box_h - 25))
 
     def _get_kanban_column_cards(self, col_name):
@@ -3185,7 +3752,7 @@ class DashboardApp:
 
             # Priority bar
             p_color = {'🔴': C['error'], '🟡': C['warning'], '🟢': C['success']}.get(card.get('priority', '🟡'), C['warning'])
-            pygame.draw.rect(self.screen, p_color, (x + 3, card_y, 4, card_h), border_radius=2)
+            self.screen.blit(self._bar(p_color, 4, card_h), (x + 3, card_y))
 
             # Title
             title = card.get('title', '?')
@@ -3225,10 +3792,7 @@ class DashboardApp:
         card = cards[self.kanban_card]
 
         # Overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(200)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay(200), (0, 0))
 
         # Popup
         pw, ph = 500, 300
@@ -3275,6 +3839,7 @@ class DashboardApp:
         }
         self.kanban_data = {k: list(v) for k, v in empty_cols.items()}
         self.kanban_fasttrack = {k: list(v) for k, v in empty_cols.items()}
+        self._kanban_card_count = 0
 
         # Map from JSON keys to display names
         col_map = {
@@ -3331,12 +3896,20 @@ class DashboardApp:
                         self.kanban_fasttrack[display_col].append(normalized)
         except Exception as e:
             pass
+        self._recount_kanban()
+
+    def _recount_kanban(self):
+        """Refresh the board card count after kanban_data changes"""
+        self._kanban_card_count = sum(len(cards) for cards in self.kanban_data.values())
 
     def _save_kanban_data(self):
         """Save kanban data to JSON file (compatible with web app format)"""
         import json
         from datetime import datetime
 
+        # Every board mutation ends in a save, so keep the home tile count current here
+        self._recount_kanban()
+
         # Map display names back to JSON keys
         col_map = {
             'Not Started': 'not-started', 'Research': 'research', 'Active': 'active',
@@ -3461,9 +4034,13 @@ class DashboardApp:
         """Draw chat panel - WOW Edition"""
         import math
 
-        if not hasattr(self, 'chat_anim'):
-            self.chat_anim = 0
-        self.chat_anim += 0.03
+        self.chat_anim += 0.03 * self._anim_step
+        self._text_blits = []
+
+        # Input forces a full flip; otherwise only a reply landing changes more than the animated bits
+        state = (len(self.messages), id(self.messages[-1]) if self.messages else None, self.chat_waiting)
+        unchanged = state == getattr(self, '_chat_state', None)
+        self._chat_state = state
 
         y_start = 44
 
@@ -3477,8 +4054,9 @@ class DashboardApp:
         self.screen.blit(header_surf, (10, y_start))
         pygame.draw.rect(self.screen, (60, 80, 120), (10, y_start, SCREEN_WIDTH - 20, 28), width=1, border_radius=8)
 
-        session_surf = self.fonts['status'].render(session_text[:50], True, (140, 170, 220))
-        self.screen.blit(session_surf, (20, y_start + 7))
+        session_text = self._truncate_to_px(session_text, 'status', SCREEN_WIDTH - 70)
+        session_surf = self._text(session_text, 'status', (140, 170, 220))
+        self._text_blits.append((session_surf, (20, y_start + 7)))
 
         # Online indicator dot
         pulse = 0.7 + 0.3 * math.sin(self.chat_anim * 3)
@@ -3489,13 +4067,12 @@ class DashboardApp:
 
         # Messages
         msg_bottom = SCREEN_HEIGHT - 65
-        messages = list(self.messages)
-
-        if self.chat_scroll > 0 and len(messages) > self.chat_scroll:
-            messages = messages[:-self.chat_scroll]
+        # Snapshot first - worker threads append to the deque while we draw (capped at 100, cheap)
+        msgs = tuple(self.messages)
+        skip = self.chat_scroll if len(msgs) > self.chat_scroll else 0
 
         y = msg_bottom
-        for msg in reversed(messages):
+        for msg in islice(reversed(msgs), skip, None):
             new_y = self._draw_bubble(msg, y, y_start + 8)
             if new_y is None:
                 break
@@ -3504,8 +4081,9 @@ class DashboardApp:
         # Scroll indicator
         if self.chat_scroll > 0:
             scroll_text = f"^ {self.chat_scroll} more"
-            scroll_surf = self.fonts['status'].render(scroll_text, True, (255, 200, 100))
-            self.screen.blit(scroll_surf, (SCREEN_WIDTH - scroll_surf.get_width() - 15, y_start - 26))
+            scroll_surf = self._text(scroll_text, 'status', (255, 200, 100))
+            self._text_blits.append((scroll_surf, (SCREEN_WIDTH - scroll_surf.get_width() - 15, y_start - 26)))
+        self._flush_text()
 
         # Input area - modern glass style
         input_y = SCREEN_HEIGHT - 58
@@ -3538,32 +4116,33 @@ class DashboardApp:
 
         # Dynamic text scrolling based on pixel width
         if self.chat_input:
-            full_width = self.fonts['input'].size(display_text)[0]
+            full_width = self._measure('input', display_text)
             if full_width > input_box_width:
-                cursor_x = self.fonts['input'].size(display_text[:cursor_pos])[0]
+                cursor_x = self._measure('input', display_text[:cursor_pos])
 
                 if cursor_x > input_box_width - 20:
-                    offset = 0
-                    while offset < len(display_text):
-                        remaining = display_text[offset:]
-                        remaining_cursor = cursor_pos - offset
-                        if self.fonts['input'].size(remaining[:remaining_cursor])[0] < input_box_width - 40:
-                            break
-                        offset += 1
+                    # Smallest offset that brings the cursor back inside the box
+                    lo, hi = 0, cursor_pos
+                    while lo < hi:
+                        mid = (lo + hi) // 2
+                        if self._measure('input', display_text[mid:cursor_pos]) < input_box_width - 40:
+                            hi = mid
+                        else:
+                            lo = mid + 1
+                    offset = lo
                     display_text = display_text[offset:]
                     cursor_pos = cursor_pos - offset
 
         is_focused = getattr(self, 'chat_focused', False)
         display = display_text or ("..." if self.chat_waiting else ("" if is_focused else "/help for commands"))
         color = (220, 230, 245) if (self.chat_input or is_focused) else (100, 115, 140)
-        surf = self.fonts['input'].render(display, True, color)
+        surf = self._text(display, 'input', color)
         self.screen.blit(surf, (22, input_y + 14))
 
         # Animated cursor - show when focused OR has input
         if (self.chat_input or is_focused) and not self.chat_waiting:
-            cursor_blink = math.sin(self.chat_anim * 5) > 0
-            if cursor_blink:
-                cx = 22 + self.fonts['input'].size(display_text[:cursor_pos])[0]
+            if self._cursor_on:
+                cx = 22 + self._measure('input', display_text[:cursor_pos])
                 pygame.draw.rect(self.screen, (100, 180, 255), (cx, input_y + 12, 2, 22), border_radius=1)
 
         # Command autocomplete popup
@@ -3572,7 +4151,14 @@ class DashboardApp:
 
         # Menu overlay
         if self.chat_menu_open:
+            self._chat_menu_bg = self.screen.copy()
             self._draw_chat_menu()
+        else:
+            self._chat_menu_bg = None
+            if unchanged:
+                # Status dot, thinking dots and the input box (cursor blink)
+                self._dirty = [pygame.Rect(SCREEN_WIDTH - 36, 52, 12, 12),
+                               pygame.Rect(10, input_y - 30, SCREEN_WIDTH - 20, 78)]
 
     def _select_autocomplete_command(self):
         """Select from cascading menu or filtered list"""
@@ -3678,9 +4264,9 @@ class DashboardApp:
                 is_sel = (i == idx)
                 if is_sel:
                     pygame.draw.rect(self.screen, (50, 70, 110), (popup_x + 4, y, popup_w - 8, 22), border_radius=4)
-                cmd_surf = self.fonts['status'].render(cmd, True, (200, 220, 255) if is_sel else (140, 160, 200))
+                cmd_surf = self._text(cmd, 'status', (200, 220, 255) if is_sel else (140, 160, 200))
                 self.screen.blit(cmd_surf, (popup_x + 10, y + 4))
-                desc_surf = self.fonts['status'].render(desc, True, color if is_sel else (80, 95, 120))
+                desc_surf = self._text(desc, 'status', color if is_sel else (80, 95, 120))
                 self.screen.blit(desc_surf, (popup_x + 100, y + 4))
                 y += 24
             return
@@ -3714,12 +4300,12 @@ class DashboardApp:
             elif is_sel:
                 pygame.draw.rect(self.screen, (40, 55, 85), (left_x + 4, y, left_w - 8, 26), border_radius=4)
             
-            cat_surf = self.fonts['status'].render(cat_name, True, cat_color if is_sel else (100, 115, 140))
+            cat_surf = self._text(cat_name, 'status', cat_color if is_sel else (100, 115, 140))
             self.screen.blit(cat_surf, (left_x + 10, y + 6))
             
             # Arrow indicator
             if is_sel:
-                arrow_surf = self.fonts['status'].render(">", True, cat_color)
+                arrow_surf = self._text(">", 'status', cat_color)
                 self.screen.blit(arrow_surf, (left_x + left_w - 18, y + 6))
             
             y += 28
@@ -3746,10 +4332,10 @@ class DashboardApp:
             if is_sel:
                 pygame.draw.rect(self.screen, (50, 70, 110), (right_x + 4, y, right_w - 8, 22), border_radius=4)
             
-            cmd_surf = self.fonts['status'].render(cmd, True, (200, 220, 255) if is_sel else (120, 140, 180))
+            cmd_surf = self._text(cmd, 'status', (200, 220, 255) if is_sel else (120, 140, 180))
             self.screen.blit(cmd_surf, (right_x + 10, y + 4))
             
-            desc_surf = self.fonts['status'].render(desc, True, (140, 155, 180) if is_sel else (70, 85, 110))
+            desc_surf = self._text(desc, 'status', (140, 155, 180) if is_sel else (70, 85, 110))
             self.screen.blit(desc_surf, (right_x + 75, y + 4))
             
             y += 24
@@ -3772,9 +4358,13 @@ class DashboardApp:
             prefix = "Bot: "
             text_color = C['success']
 
-        # Word wrap with prefix on first line
-        full_text = prefix + msg.text
-        lines = self._word_wrap(full_text, 'msg', max_w)
+        # Word wrap with prefix on first line (once per message)
+        if msg.lines is None or msg.font_gen != self._font_gen:
+            msg.font_gen = self._font_gen
+            msg.lines = self._word_wrap(prefix + msg.text, 'msg', max_w)
+            msg.surfs = [self.fonts['msg'].render(line, True, C['text']).convert_alpha() for line in msg.lines]
+        lines = msg.lines
+        surfs = msg.surfs
 
         # Calculate how many lines we can fit
         available_height = y - min_y
@@ -3784,10 +4374,12 @@ class DashboardApp:
         truncated = False
         if len(lines) > max_lines:
             lines = lines[:max_lines]
+            surfs = surfs[:max_lines]
             truncated = True
             # Add ellipsis to last line
             if lines:
                 lines[-1] = lines[-1][:30] + "..."
+                surfs[-1] = self._text(lines[-1], 'msg', C['text'])
 
         msg_h = len(lines) * self.line_height + 2
 
@@ -3797,98 +4389,123 @@ class DashboardApp:
 
         y = y - msg_h
 
-        # Draw lines
+        # Role color as a small bar in the margin - each line is then one pre-rendered surface
+        blits = self._text_blits
+        blits.append((self._bar(text_color, 3, self.line_height - 4), (1, y + 2)))
+
+        # Queue lines - draw_chat flushes the whole message list in one call
         ty = y
-        for i, line in enumerate(lines):
-            if i == 0:
-                prefix_surf = self.fonts['msg'].render(prefix, True, text_color)
-                self.screen.blit(prefix_surf, (margin, ty))
-
-                text_after = line[len(prefix):]
-                if text_after:
-                    text_surf = self.fonts['msg'].render(text_after, True, C['text'])
-                    prefix_w = self.fonts['msg'].size(prefix)[0]
-                    self.screen.blit(text_surf, (margin + prefix_w, ty))
-            else:
-                surf = self.fonts['msg'].render(line, True, C['text'])
-                self.screen.blit(surf, (margin, ty))
+        for surf in surfs:
+            blits.append((surf, (margin, ty)))
             ty += self.line_height
 
         return y - 2
 
     def _word_wrap(self, text, font, max_w):
+        # Running width sum: each word is measured once instead of re-measuring the line
         words = text.replace('\n', ' \n ').split(' ')
-        lines, current = [], ""
+        space_w = self._measure(font, ' ')
+        lines, current, cur_w = [], "", 0
         for word in words:
             if word == '\n':
                 if current: lines.append(current)
-                current = ""
+                current, cur_w = "", 0
                 continue
-            test = current + (' ' if current else '') + word
-            if self.fonts[font].size(test)[0] <= max_w:
-                current = test
+            word_w = self._measure(font, word)
+            test_w = cur_w + space_w + word_w if current else word_w
+            if test_w <= max_w:
+                current = current + ' ' + word if current else word
+                cur_w = test_w
             else:
                 if current: lines.append(current)
-                current = word
+                current, cur_w = word, word_w
         if current: lines.append(current)
         return lines or [""]
 
-    def _draw_chat_menu(self):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        self.screen.blit(overlay, (0, 0))
+    def _chat_menu_layout(self):
+        """Chat menu geometry plus its static chrome for the current mode, rebuilt only on mode change"""
+        mode = self.chat_menu_mode
+        if self._menu_layout is None or self._menu_layout['mode'] != mode:
+            menu_w, menu_h = 500, 380
+            menu_x = (SCREEN_WIDTH - menu_w) // 2
+            menu_y = (SCREEN_HEIGHT - menu_h) // 2
+            title, title_color, hint = {
+                'confirm_archive': ("Archive Session?", C['warning'], "Y: Confirm | N/Esc: Cancel"),
+                'confirm_delete': ("Delete Session?", C['error'], "Y: Confirm | N/Esc: Cancel"),
+                'rename': ("Rename Session", C['accent'], "Enter: Save | Esc: Cancel"),
+                'archived': ("📦 Archived Sessions", C['text_bright'], "A:Unarchive D:Delete Esc:Back"),
+            }.get(mode, ("Sessions", C['text_bright'], "Enter:Select R:Rename A:Archive D:Del"))
+
+            # Panel, title, divider and hint composed once into a single surface
+            chrome = pygame.Surface((menu_w, menu_h), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.rect(chrome, C['bg_overlay'], (0, 0, menu_w, menu_h), border_radius=10)
+            pygame.draw.rect(chrome, C['border'], (0, 0, menu_w, menu_h), width=1, border_radius=10)
+            chrome.blit(self._text(title, 'menu_title', title_color), (16, 12))
+            pygame.draw.line(chrome, C['border'], (10, 38), (menu_w - 10, 38))
+            hint_surf = self._text(hint, 'status', C['text_muted'])
+            chrome.blit(hint_surf, ((menu_w - hint_surf.get_width()) // 2, menu_h - 20))
+            if mode == 'rename':
+                pygame.draw.rect(chrome, C['bg_input'], (15, 60, menu_w - 30, 36), border_radius=6)
+                pygame.draw.rect(chrome, C['border'], (15, 60, menu_w - 30, 36), width=1, border_radius=6)
+
+            self._menu_layout = {
+                'mode': mode,
+                'rect': (menu_x, menu_y, menu_w, menu_h),
+                'chrome': chrome,
+            }
+        return self._menu_layout
+
+    def _chat_menu_view_state(self):
+        """Everything the sessions menu draws from, for cheap change detection"""
+        return (id(self.available_sessions), getattr(self, '_sessions_loading', False), self.chat_menu_mode,
+                self.chat_menu_selection, self.chat_menu_scroll, len(self.settings.archived_sessions))
 
-        menu_w, menu_h = 500, 380
-        menu_x = (SCREEN_WIDTH - menu_w) // 2
-        menu_y = (SCREEN_HEIGHT - menu_h) // 2
+    def _draw_chat_menu(self):
+        self._chat_menu_state = self._chat_menu_view_state()
+        self.screen.blit(self._dim_overlay(180), (0, 0))
+        self._text_blits = []  # Menu text is batched and flushed in one call
 
-        pygame.draw.rect(self.screen, C['bg_overlay'], (menu_x, menu_y, menu_w, menu_h), border_radius=10)
-        pygame.draw.rect(self.screen, C['border'], (menu_x, menu_y, menu_w, menu_h), width=1, border_radius=10)
+        layout = self._chat_menu_layout()
+        menu_x, menu_y, menu_w, menu_h = layout['rect']
+        self.screen.blit(layout['chrome'], (menu_x, menu_y))
 
         # Handle different menu modes
         if self.chat_menu_mode == 'confirm_archive':
             self._draw_confirm_session_dialog(menu_x, menu_y, menu_w, menu_h, 'archive')
+            self._flush_text()
             return
         elif self.chat_menu_mode == 'confirm_delete':
             self._draw_confirm_session_dialog(menu_x, menu_y, menu_w, menu_h, 'delete')
+            self._flush_text()
             return
         elif self.chat_menu_mode == 'rename':
             self._draw_rename_dialog(menu_x, menu_y, menu_w, menu_h)
+            self._flush_text()
             return
         elif self.chat_menu_mode == 'archived':
             self._draw_archived_menu(menu_x, menu_y, menu_w, menu_h)
+            self._flush_text()
             return
 
         # Main sessions menu
-        title = "Sessions"
-        title_surf = self.fonts['menu_title'].render(title, True, C['text_bright'])
-        self.screen.blit(title_surf, (menu_x + 16, menu_y + 12))
-
         # Loading indicator
         if hasattr(self, '_sessions_loading') and self._sessions_loading:
-            loading_surf = self.fonts['status'].render("loading...", True, C['accent'])
-            self.screen.blit(loading_surf, (menu_x + menu_w - 80, menu_y + 14))
+            loading_surf = self._text("loading...", 'status', C['accent'])
+            self._text_blits.append((loading_surf, (menu_x + menu_w - 80, menu_y + 14)))
 
         # Archived count
         archived_count = len(self.settings.archived_sessions)
         if archived_count > 0:
             arch_text = f"📦 {archived_count}"
-            arch_surf = self.fonts['status'].render(arch_text, True, C['text_dim'])
-            self.screen.blit(arch_surf, (menu_x + menu_w - 45, menu_y + 14))
-
-        pygame.draw.line(self.screen, C['border'], (menu_x + 10, menu_y + 38), (menu_x + menu_w - 10, menu_y + 38))
+            arch_surf = self._text(arch_text, 'status', C['text_dim'])
+            self._text_blits.append((arch_surf, (menu_x + menu_w - 45, menu_y + 14)))
 
-        # Build items list: New Session + sessions + View Archived
-        items = [{'type': 'new', 'name': '➕ New Session'}]
-        for s in self.available_sessions:
-            items.append({'type': 'session', 'key': s['key'], 'name': s['name']})
-        if archived_count > 0:
-            items.append({'type': 'archived', 'name': f'📦 View Archived ({archived_count})'})
+        # Items are New Session + sessions + View Archived; only visible rows are built
+        sessions = self.available_sessions
+        total_items = self._sessions_menu_counts()[0]
 
         # Scrolling
         max_visible = 9
-        total_items = len(items)
 
         # Ensure selection stays in bounds
         self.chat_menu_selection = max(0, min(self.chat_menu_selection, total_items - 1))
@@ -3900,55 +4517,49 @@ class DashboardApp:
             self.chat_menu_scroll = self.chat_menu_selection - max_visible + 1
 
         # Draw visible items
-        visible_items = items[self.chat_menu_scroll:self.chat_menu_scroll + max_visible]
         item_y = menu_y + 46
 
-        for i, item in enumerate(visible_items):
-            actual_idx = self.chat_menu_scroll + i
+        for actual_idx in range(self.chat_menu_scroll, min(total_items, self.chat_menu_scroll + max_visible)):
             is_sel = actual_idx == self.chat_menu_selection
 
             is_current = False
-            if item['type'] == 'session':
+            if actual_idx == 0:
+                name = '➕ New Session'
+            elif actual_idx <= len(sessions):
+                session = sessions[actual_idx - 1]
+                name = session['name']
                 # Check exact match or if session key ends with our key (handles agent:main:X vs X)
-                is_current = (item['key'] == self.settings.session_key or
-                             item['key'].endswith(':' + self.settings.session_key))
+                is_current = (session['key'] == self.settings.session_key or
+                             session['key'].endswith(':' + self.settings.session_key))
+            else:
+                name = f'📦 View Archived ({archived_count})'
 
             if is_sel:
-                pygame.draw.rect(self.screen, C['bg_item_hover'], (menu_x + 10, item_y, menu_w - 20, 34), border_radius=6)
+                self.screen.blit(self._bar(C['bg_item_hover'], menu_w - 20, 34, 6), (menu_x + 10, item_y))
 
             prefix = "✓ " if is_current else "  "
             color = C['accent'] if is_current else (C['text_bright'] if is_sel else C['text'])
 
-            display_name = item['name'][:35]
-            surf = self.fonts['msg'].render(prefix + display_name, True, color)
-            self.screen.blit(surf, (menu_x + 16, item_y + 7))
+            display_name = self._truncate_to_px(name, 'msg', menu_w - 90)
+            surf = self._text(prefix + display_name, 'msg', color)
+            self._text_blits.append((surf, (menu_x + 16, item_y + 7)))
             item_y += 36
 
         # Scroll indicators
         if self.chat_menu_scroll > 0:
-            up_surf = self.fonts['status'].render("▲ more", True, C['text_dim'])
-            self.screen.blit(up_surf, (menu_x + menu_w - 55, menu_y + 42))
+            up_surf = self._text("▲ more", 'status', C['text_dim'])
+            self._text_blits.append((up_surf, (menu_x + menu_w - 55, menu_y + 42)))
         if self.chat_menu_scroll + max_visible < total_items:
-            down_surf = self.fonts['status'].render("▼ more", True, C['text_dim'])
-            self.screen.blit(down_surf, (menu_x + menu_w - 55, menu_y + menu_h - 38))
-
-        # Hints at bottom
-        hint = "Enter:Select R:Rename A:Archive D:Del"
-        hint_surf = self.fonts['status'].render(hint, True, C['text_muted'])
-        self.screen.blit(hint_surf, (menu_x + (menu_w - hint_surf.get_width()) // 2, menu_y + menu_h - 20))
+            down_surf = self._text("▼ more", 'status', C['text_dim'])
+            self._text_blits.append((down_surf, (menu_x + menu_w - 55, menu_y + menu_h - 38)))
+        self._flush_text()
 
     def _draw_archived_menu(self, menu_x, menu_y, menu_w, menu_h):
         """Draw the archived sessions popup"""
-        title = "📦 Archived Sessions"
-        title_surf = self.fonts['menu_title'].render(title, True, C['text_bright'])
-        self.screen.blit(title_surf, (menu_x + 16, menu_y + 12))
-
-        pygame.draw.line(self.screen, C['border'], (menu_x + 10, menu_y + 38), (menu_x + menu_w - 10, menu_y + 38))
-
         archived = self._get_archived_sessions()
         if not archived:
-            empty_surf = self.fonts['msg'].render("No archived sessions", True, C['text_dim'])
-            self.screen.blit(empty_surf, (menu_x + 20, menu_y + 60))
+            empty_surf = self._text("No archived sessions", 'msg', C['text_dim'])
+            self._text_blits.append((empty_surf, (menu_x + 20, menu_y + 60)))
         else:
             max_visible = 6
             total = len(archived)
@@ -3960,106 +4571,78 @@ class DashboardApp:
             elif self.chat_menu_selection >= self.chat_menu_scroll + max_visible:
                 self.chat_menu_scroll = self.chat_menu_selection - max_visible + 1
 
-            visible = archived[self.chat_menu_scroll:self.chat_menu_scroll + max_visible]
             item_y = menu_y + 46
 
-            for i, item in enumerate(visible):
-                actual_idx = self.chat_menu_scroll + i
+            for actual_idx in range(self.chat_menu_scroll, min(total, self.chat_menu_scroll + max_visible)):
+                item = archived[actual_idx]
                 is_sel = actual_idx == self.chat_menu_selection
 
                 if is_sel:
-                    pygame.draw.rect(self.screen, C['bg_item_hover'], (menu_x + 8, item_y, menu_w - 16, 26), border_radius=4)
+                    self.screen.blit(self._bar(C['bg_item_hover'], menu_w - 16, 26, 4), (menu_x + 8, item_y))
 
                 color = C['text_bright'] if is_sel else C['text_dim']
-                surf = self.fonts['menu'].render(item['name'][:26], True, color)
-                self.screen.blit(surf, (menu_x + 12, item_y + 5))
+                surf = self._text(item['display_name'], 'menu', color)
+                self._text_blits.append((surf, (menu_x + 12, item_y + 5)))
                 item_y += 28
 
-        hint = "A:Unarchive D:Delete Esc:Back"
-        hint_surf = self.fonts['status'].render(hint, True, C['text_muted'])
-        self.screen.blit(hint_surf, (menu_x + (menu_w - hint_surf.get_width()) // 2, menu_y + menu_h - 20))
-
     def _draw_confirm_session_dialog(self, menu_x, menu_y, menu_w, menu_h, action):
-        """Draw confirmation dialog for archive/delete"""
-        if action == 'archive':
-            title = "Archive Session?"
-            color = C['warning']
-        else:
-            title = "Delete Session?"
-            color = C['error']
-
-        title_surf = self.fonts['menu_title'].render(title, True, color)
-        self.screen.blit(title_surf, (menu_x + 16, menu_y + 12))
-
-        pygame.draw.line(self.screen, C['border'], (menu_x + 10, menu_y + 38), (menu_x + menu_w - 10, menu_y + 38))
-
+        """Draw confirmation dialog for archive/delete (title and hint are in the menu chrome)"""
         # Show session name
         if self.session_action_target:
-            name = self.session_action_target.get('name', 'Unknown')[:30]
-            name_surf = self.fonts['msg'].render(name, True, C['text'])
-            self.screen.blit(name_surf, (menu_x + 20, menu_y + 60))
+            name = self._truncate_to_px(self.session_action_target.get('name', 'Unknown'), 'msg', menu_w - 40)
+            name_surf = self._text(name, 'msg', C['text'])
+            self._text_blits.append((name_surf, (menu_x + 20, menu_y + 60)))
 
             if action == 'archive':
                 desc = "Session will be hidden from list"
             else:
                 desc = "This cannot be undone!"
-            desc_surf = self.fonts['status'].render(desc, True, C['text_dim'])
-            self.screen.blit(desc_surf, (menu_x + 20, menu_y + 90))
-
-        # Y/N buttons
-        hint = "Y: Confirm | N/Esc: Cancel"
-        hint_surf = self.fonts['status'].render(hint, True, C['text_muted'])
-        self.screen.blit(hint_surf, (menu_x + (menu_w - hint_surf.get_width()) // 2, menu_y + menu_h - 20))
+            desc_surf = self._text(desc, 'status', C['text_dim'])
+            self._text_blits.append((desc_surf, (menu_x + 20, menu_y + 90)))
 
     def _draw_rename_dialog(self, menu_x, menu_y, menu_w, menu_h):
-        """Draw rename input dialog"""
-        title = "Rename Session"
-        title_surf = self.fonts['menu_title'].render(title, True, C['accent'])
-        self.screen.blit(title_surf, (menu_x + 16, menu_y + 12))
-
-        pygame.draw.line(self.screen, C['border'], (menu_x + 10, menu_y + 38), (menu_x + menu_w - 10, menu_y + 38))
-
-        # Input box
-        input_rect = (menu_x + 15, menu_y + 60, menu_w - 30, 36)
-        pygame.draw.rect(self.screen, C['bg_input'], input_rect, border_radius=6)
-        pygame.draw.rect(self.screen, C['border'], input_rect, width=1, border_radius=6)
-
+        """Draw rename input dialog (title, input box and hint are in the menu chrome)"""
         # Text
         display_text = self.session_rename_text or "Enter new name..."
         text_color = C['text'] if self.session_rename_text else C['text_muted']
-        text_surf = self.fonts['input'].render(display_text[:25], True, text_color)
-        self.screen.blit(text_surf, (menu_x + 22, menu_y + 70))
+        text_surf = self._text(display_text[:25], 'input', text_color)
+        self._text_blits.append((text_surf, (menu_x + 22, menu_y + 70)))
 
         # Cursor
-        if self.session_rename_text and int(time.time() * 2) % 2:
-            cursor_x = menu_x + 22 + self.fonts['input'].size(self.session_rename_text[:self.session_rename_cursor])[0]
+        if self.session_rename_text and self._cursor_on:
+            cursor_x = menu_x + 22 + self._rename_cursor_x
             pygame.draw.rect(self.screen, C['cursor'], (cursor_x, menu_y + 66, 2, 24))
 
-        hint = "Enter: Save | Esc: Cancel"
-        hint_surf = self.fonts['status'].render(hint, True, C['text_muted'])
-        self.screen.blit(hint_surf, (menu_x + (menu_w - hint_surf.get_width()) // 2, menu_y + menu_h - 20))
-
     def draw(self):
-        # Screen off mode - just black
+        # Screen off mode - flip one black frame, then skip drawing entirely
         if self.screen_off:
-            self.screen.fill((0, 0, 0))
-            pygame.display.flip()
+            if not self._blanked:
+                self.screen.fill((0, 0, 0))
+                pygame.display.flip()
+                self._blanked = True
+            return
+        if self._blanked:
+            self._blanked = False
+            self._full_redraw = True
+
+        self._dirty = None
+
+        # Chat menu open over an unchanged view: restore the snapshot, redraw and push only the popup
+        if (self.mode == MODE_CHAT and self.chat_menu_open and
+                self._chat_menu_bg is not None and not self._full_redraw):
+            self.screen.blit(self._chat_menu_bg, (0, 0))
+            self._draw_chat_menu()
+            self._dirty = [pygame.Rect(self._menu_layout['rect'])]
+            self._present()
             return
 
         self.screen.fill(C['bg'])
         self.draw_tabs()
 
         try:
-            if self.mode == MODE_DASHBOARD:
-                self.draw_dashboard()
-            elif self.mode == MODE_TASKS:
-                self.draw_tasks()
-            elif self.mode == MODE_CHAT:
-                self.draw_chat()
-            elif self.mode == MODE_COMMANDS:
-                self.draw_commands()
-            elif self.mode == MODE_KANBAN:
-                self.draw_kanban()
+            drawer = self._mode_drawers.get(self.mode)
+            if drawer:
+                drawer()
         except Exception as e:
             # Show error on screen instead of crashing
             self.screen.fill((30, 20, 20))
@@ -4067,8 +4650,31 @@ class DashboardApp:
             self.screen.blit(err_surf, (20, 200))
             hint_surf = self.fonts['status'].render("Press any key to continue", True, (150, 150, 150))
             self.screen.blit(hint_surf, (20, 240))
+            self._dirty = None
+
+        self._present()
+
+    def _frame_is_static(self):
+        """True when the current view cannot change until input arrives"""
+        if self.screen_off:
+            return self._blanked
+        if self.mode == MODE_COMMANDS:
+            return (not self.command_running and
+                    self._commands_view_state() == getattr(self, '_commands_state', None))
+        if self.mode == MODE_CHAT and self.chat_menu_open and self._chat_menu_bg is not None:
+            return (self.chat_menu_mode != 'rename' and
+                    self._chat_menu_view_state() == getattr(self, '_chat_menu_state', None))
+        return False
 
-        pygame.display.flip()
+    def _present(self):
+        """Push the frame: update(rects) for small dirty areas, flip otherwise"""
+        dirty = self._dirty
+        if (self._full_redraw or dirty is None or
+                sum(r.w * r.h for r in dirty) > SCREEN_WIDTH * SCREEN_HEIGHT // 2):
+            pygame.display.flip()
+        elif dirty:
+            pygame.display.update(dirty)
+        self._full_redraw = False
 
     def handle_key(self, event):
         # Wake from screen off on any key
@@ -4076,69 +4682,34 @@ class DashboardApp:
             self.screen_off = False
             return
 
-        # Global keys
-        if event.key == pygame.K_F1:
-            self.switch_mode(MODE_DASHBOARD)
-            return
-        elif event.key == pygame.K_F2:
-            self.switch_mode(MODE_TASKS)
-            return
-        elif event.key == pygame.K_F3:
-            self.switch_mode(MODE_CHAT)
-            return
-        elif event.key == pygame.K_F4:
-            self.switch_mode(MODE_KANBAN)
-            return
-        elif event.key == pygame.K_F5:
-            self.switch_mode(MODE_COMMANDS)
-            return
-
-        # Ctrl+Q behavior
-        if event.key == pygame.K_q and event.mod & pygame.KMOD_CTRL:
-            if self.mode == MODE_DASHBOARD:
-                return 'quit'
-            else:
-                self.switch_mode(MODE_DASHBOARD)
-                return
+        # Global keys - one lookup on (key, ctrl held) before the mode handlers
+        action = self._global_keys.get((event.key, bool(event.mod & pygame.KMOD_CTRL)))
+        if action:
+            return action()
 
         # Mode-specific
+        handler = self._mode_key_handlers.get(self.mode)
+        if handler:
+            handler(event)
+
+    def _ctrl_q(self):
+        """Ctrl+Q quits from the dashboard, otherwise returns to it"""
         if self.mode == MODE_DASHBOARD:
-            self._handle_dashboard_key(event)
-        elif self.mode == MODE_CHAT:
-            self._handle_chat_key(event)
-        elif self.mode == MODE_COMMANDS:
-            self._handle_commands_key(event)
-        elif self.mode == MODE_TASKS:
-            self._handle_tasks_key(event)
-        elif self.mode == MODE_KANBAN:
-            self._handle_kanban_key(event)
+            return 'quit'
+        self.switch_mode(MODE_DASHBOARD)
 
     def _handle_dashboard_key(self, event):
         """Handle keyboard input for dashboard"""
-        if event.key == pygame.K_g:
-            # Toggle gateway connection
-            self._toggle_gateway()
-        elif event.key == pygame.K_t:
-            # Switch to Tasks
-            self.switch_mode(MODE_TASKS)
-        elif event.key == pygame.K_c:
-            # Switch to Chat
-            self.switch_mode(MODE_CHAT)
-        elif event.key == pygame.K_k:
-            # Switch to Kanban
-            self.switch_mode(MODE_KANBAN)
+        action = self._dashboard_keys.get(event.key)
+        if action:
+            action()
 
     def _handle_chat_key(self, event):
         if self.chat_menu_open:
             # Handle different menu modes
-            if self.chat_menu_mode == 'rename':
-                self._handle_rename_input(event)
-                return
-            elif self.chat_menu_mode in ('confirm_archive', 'confirm_delete'):
-                self._handle_confirm_input(event)
-                return
-            elif self.chat_menu_mode == 'archived':
-                self._handle_archived_menu(event)
+            sub_handler = self._chat_menu_handlers.get(self.chat_menu_mode)
+            if sub_handler:
+                sub_handler(event)
                 return
 
             # Main sessions menu
@@ -4148,10 +4719,7 @@ class DashboardApp:
             elif event.key == pygame.K_UP:
                 self.chat_menu_selection = max(0, self.chat_menu_selection - 1)
             elif event.key == pygame.K_DOWN:
-                # Calculate max based on items list
-                items_count = 1 + len(self.available_sessions)  # New Session + sessions
-                if self.settings.archived_sessions:
-                    items_count += 1  # View Archived
+                items_count = self._sessions_menu_counts()[0]
                 self.chat_menu_selection = min(self.chat_menu_selection + 1, items_count - 1)
             elif event.key == pygame.K_RETURN:
                 if hasattr(self, '_sessions_loading') and self._sessions_loading:
@@ -4159,15 +4727,14 @@ class DashboardApp:
                 if self.available_sessions and self.available_sessions[0].get('key') == 'loading':
                     return
 
-                # Calculate what item is selected
-                items_count = 1 + len(self.available_sessions)
-                has_archived = len(self.settings.archived_sessions) > 0
+                # Calculate what item is selected (View Archived sits after the sessions)
+                items_count, has_archived = self._sessions_menu_counts()
 
                 if self.chat_menu_selection == 0:
                     # New Session
                     new_name = f"pi-{datetime.now().strftime('%H%M%S')}"
                     self.settings.session_key = new_name
-                    self.settings.save()
+                    self._save_settings_soon()
                     self.conversation.clear()
                     self.messages.clear()
                     self.messages.append(Message(f"New: {new_name}", 'system'))
@@ -4176,12 +4743,12 @@ class DashboardApp:
                     # Switch to session
                     selected = self.available_sessions[self.chat_menu_selection - 1]
                     self.settings.session_key = selected['key']
-                    self.settings.save()
+                    self._save_settings_soon()
                     self.conversation.clear()
                     self.messages.clear()
                     self.messages.append(Message(f"Switched: {selected['name'][:20]}", 'system'))
                     self.chat_menu_open = False
-                elif has_archived and self.chat_menu_selection == items_count:
+                elif has_archived and self.chat_menu_selection == items_count - 1:
                     # View Archived
                     self.chat_menu_mode = 'archived'
                     self.chat_menu_selection = 0
@@ -4193,6 +4760,7 @@ class DashboardApp:
                     self.session_action_target = selected
                     self.session_rename_text = selected.get('name', '')
                     self.session_rename_cursor = len(self.session_rename_text)
+                    self._update_rename_cursor_x()
                     self.chat_menu_mode = 'rename'
             elif event.key == pygame.K_a:
                 # Archive
@@ -4340,19 +4908,46 @@ class DashboardApp:
             self.chat_menu_selection = 0
             self.chat_menu_scroll = 0
             self._fetch_sessions()
-        elif event.unicode and ord(event.unicode) >= 32:
+
+    def _text_context(self):
+        """Which text field typed characters currently go to, or None"""
+        if self.screen_off:
+            return None  # The key that wakes the display is swallowed, not typed
+        if self.mode == MODE_CHAT:
+            if not self.chat_menu_open:
+                return 'chat'
+            if self.chat_menu_mode == 'rename':
+                return 'rename'
+        elif self.mode == MODE_TASKS and self.task_editing and not getattr(self, 'task_saving', False):
+            return 'task'
+        return None
+
+    def _handle_text_input(self, text):
+        """Insert TEXTINPUT characters at the cursor of the focused field"""
+        ctx = self._text_context()
+        # Skip text from the key that just opened this field (e.g. 'n' for new task, 'r' for rename)
+        if ctx is None or ctx != self._text_ctx_at_key:
+            return
+        if ctx == 'chat':
             # Delete selection if any before inserting
             sel_start = getattr(self, 'chat_select_start', self.chat_cursor)
             sel_end = getattr(self, 'chat_select_end', self.chat_cursor)
             if sel_start != sel_end:
                 self.chat_input = self.chat_input[:min(sel_start, sel_end)] + self.chat_input[max(sel_start, sel_end):]
                 self.chat_cursor = min(sel_start, sel_end)
-            self.chat_input = self.chat_input[:self.chat_cursor] + event.unicode + self.chat_input[self.chat_cursor:]
-            self.chat_cursor += 1
+            self.chat_input = self.chat_input[:self.chat_cursor] + text + self.chat_input[self.chat_cursor:]
+            self.chat_cursor += len(text)
             self.chat_select_start = self.chat_cursor
             self.chat_select_end = self.chat_cursor
             # Reset autocomplete selection when typing
             self.cmd_autocomplete_idx = 0
+        elif ctx == 'rename':
+            self.session_rename_text = self.session_rename_text[:self.session_rename_cursor] + text + self.session_rename_text[self.session_rename_cursor:]
+            self.session_rename_cursor += len(text)
+            self._update_rename_cursor_x()
+        elif ctx == 'task':
+            self.task_edit_text = self.task_edit_text[:self.task_edit_cursor] + text + self.task_edit_text[self.task_edit_cursor:]
+            self.task_edit_cursor += len(text)
 
     def _handle_rename_input(self, event):
         """Handle keyboard input for rename dialog"""
@@ -4363,7 +4958,8 @@ class DashboardApp:
             if self.session_action_target and self.session_rename_text.strip():
                 key = self.session_action_target.get('key', '')
                 self.settings.session_renames[key] = self.session_rename_text.strip()
-                self.settings.save()
+                self._session_lists_changed()
+                self._save_settings_soon()
                 self._fetch_sessions()  # Refresh list
             self.chat_menu_mode = 'sessions'
         elif event.key == pygame.K_BACKSPACE:
@@ -4374,9 +4970,11 @@ class DashboardApp:
             self.session_rename_cursor = max(0, self.session_rename_cursor - 1)
         elif event.key == pygame.K_RIGHT:
             self.session_rename_cursor = min(len(self.session_rename_text), self.session_rename_cursor + 1)
-        elif event.unicode and ord(event.unicode) >= 32:
-            self.session_rename_text = self.session_rename_text[:self.session_rename_cursor] + event.unicode + self.session_rename_text[self.session_rename_cursor:]
-            self.session_rename_cursor += 1
+        self._update_rename_cursor_x()
+
+    def _update_rename_cursor_x(self):
+        """Measure the rename cursor offset once per edit instead of every frame"""
+        self._rename_cursor_x = self._measure('input', self.session_rename_text[:self.session_rename_cursor])
 
     def _handle_confirm_input(self, event):
         """Handle Y/N confirmation for archive/delete"""
@@ -4390,35 +4988,41 @@ class DashboardApp:
                     # Archive the session
                     if key and key not in self.settings.archived_sessions:
                         self.settings.archived_sessions.append(key)
-                        self.settings.save()
+                        self._session_lists_changed()
+                        self._save_settings_soon()
                         self.messages.append(Message(f"Archived session", 'system'))
+                    self._fetch_sessions()  # Refresh
                 elif self.chat_menu_mode == 'confirm_delete':
                     # Delete session from settings
                     if key in self.settings.session_renames:
                         del self.settings.session_renames[key]
                     if key in self.settings.archived_sessions:
                         self.settings.archived_sessions.remove(key)
-                    self.settings.save()
-
-                    # Also delete from sessions.json
-                    try:
-                        sessions_file = Path.home() / '.openclaw' / 'agents' / 'main' / 'sessions' / 'sessions.json'
-                        if sessions_file.exists():
-                            with open(sessions_file) as f:
-                                sessions_data = json.load(f)
-                            if key in sessions_data:
-                                del sessions_data[key]
-                                with open(sessions_file, 'w') as f:
-                                    json.dump(sessions_data, f, indent=2)
-                    except Exception as e:
-                        pass  # Silently fail if can't delete from file
+                    self._session_lists_changed()
+                    self._save_settings_soon()
 
+                    # Also delete from sessions.json (refreshes the list once written)
+                    self._io_queue.put((self._persist_delete_session, (key,)))
                     self.messages.append(Message(f"Deleted session", 'system'))
-                self._fetch_sessions()  # Refresh
             self.chat_menu_mode = 'sessions'
             self.session_action_target = None
             self.chat_menu_selection = 0
 
+    def _persist_delete_session(self, key):
+        """Remove a session from sessions.json (runs on the IO worker)"""
+        try:
+            sessions_file = Path.home() / '.openclaw' / 'agents' / 'main' / 'sessions' / 'sessions.json'
+            if sessions_file.exists():
+                with open(sessions_file) as f:
+                    sessions_data = json.load(f)
+                if key in sessions_data:
+                    del sessions_data[key]
+                    with open(sessions_file, 'w') as f:
+                        json.dump(sessions_data, f, indent=2)
+        except Exception as e:
+            pass  # Silently fail if can't delete from file
+        self._fetch_sessions()
+
     def _handle_archived_menu(self, event):
         """Handle keyboard input for archived sessions menu"""
         archived = self._get_archived_sessions()
@@ -4438,7 +5042,8 @@ class DashboardApp:
                 key = archived[self.chat_menu_selection]['key']
                 if key in self.settings.archived_sessions:
                     self.settings.archived_sessions.remove(key)
-                    self.settings.save()
+                    self._session_lists_changed()
+                    self._save_settings_soon()
                     self.messages.append(Message(f"Unarchived session", 'system'))
                     self._fetch_sessions()
                     if not self.settings.archived_sessions:
@@ -4534,6 +5139,7 @@ class DashboardApp:
                     task = self.tasks[self.task_selected]
                     if isinstance(task.get('id'), int):  # Local temp task
                         self.tasks.pop(self.task_selected)
+                        self._pending_count -= 1
                         if self.task_selected >= len(self.tasks) and self.tasks:
                             self.task_selected = len(self.tasks) - 1
                 self.task_editing = False
@@ -4551,9 +5157,6 @@ class DashboardApp:
                 self.task_edit_cursor = 0
             elif event.key == pygame.K_END:
                 self.task_edit_cursor = len(self.task_edit_text)
-            elif event.unicode and ord(event.unicode) >= 32:
-                self.task_edit_text = self.task_edit_text[:self.task_edit_cursor] + event.unicode + self.task_edit_text[self.task_edit_cursor:]
-                self.task_edit_cursor += 1
         else:
             # Navigation mode
             if event.key == pygame.K_UP:
@@ -4600,7 +5203,7 @@ class DashboardApp:
                 self.cycle_task_priority()
             elif event.key == pygame.K_r:
                 # Manual refresh
-                self._load_todoist_tasks()
+                self._refresh_tasks_async()
             elif event.key == pygame.K_z and (event.mod & pygame.KMOD_CTRL):
                 # Undo last action
                 self.undo_last_action()
@@ -4649,12 +5252,18 @@ class DashboardApp:
         """Execute a system submenu item, with confirmation if needed"""
         if item.get('confirm'):
             self.system_submenu_open = False
+            self._status_batch = None
             self.system_submenu_confirm = item
         else:
             self.system_submenu_open = False
+            # Status items are served from the batch prefetched when the menu opened
+            cached, self._status_batch = self._status_batch, None
+            if item.get('key') and cached and item['key'] in cached:
+                self.command_result = ('success', cached[item['key']][:100])
+                return
             self.command_running = item['label']
             self.command_result = None
-            threading.Thread(target=self._run_command_async, args=({'cmd': item['cmd'], 'label': item['label']},), daemon=True).start()
+            self._jobs.put((self._run_command_async, ({'cmd': item['cmd'], 'label': item['label']},)))
 
     def _handle_commands_key(self, event):
         # Handle system submenu confirmation
@@ -4664,7 +5273,7 @@ class DashboardApp:
                 self.system_submenu_confirm = None
                 self.command_running = item['label']
                 self.command_result = None
-                threading.Thread(target=self._run_command_async, args=({'cmd': item['cmd'], 'label': item['label']},), daemon=True).start()
+                self._jobs.put((self._run_command_async, ({'cmd': item['cmd'], 'label': item['label']},)))
             elif event.key == pygame.K_ESCAPE or event.key == pygame.K_n:
                 self.system_submenu_confirm = None
             return
@@ -4674,6 +5283,7 @@ class DashboardApp:
             submenu = self.get_system_submenu()
             if event.key == pygame.K_ESCAPE:
                 self.system_submenu_open = False
+                self._status_batch = None
             elif event.key == pygame.K_UP:
                 self.system_submenu_selection = max(0, self.system_submenu_selection - 1)
             elif event.key == pygame.K_DOWN:
@@ -5202,20 +5812,58 @@ class DashboardApp:
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.KEYDOWN:
+                    self._full_redraw = True
+                    self._last_activity = time.monotonic()
+                    self._needs_redraw = True
+                    # Keep the cursor solid while typing
+                    self._cursor_on = True
+                    self._next_blink = pygame.time.get_ticks() + 500
+                    self._text_ctx_at_key = self._text_context()
                     result = self.handle_key(event)
                     if result == 'quit':
                         running = False
+                elif event.type == pygame.TEXTINPUT:
+                    self._full_redraw = True
+                    self._last_activity = time.monotonic()
+                    self._needs_redraw = True
+                    self._handle_text_input(event.text)
                 elif event.type == pygame.MOUSEBUTTONDOWN:
+                    self._full_redraw = True
+                    self._last_activity = time.monotonic()
+                    self._needs_redraw = True
                     # Tab clicks
                     if event.pos[1] < 28:
-                        tab_idx = event.pos[0] // (SCREEN_WIDTH // 4)
+                        tab_idx = event.pos[0] // TAB_W
                         if 0 <= tab_idx < 4:
                             self.switch_mode(tab_idx)
 
-            self.draw()
-            # Slow refresh when screen is off to save CPU
-            self.clock.tick(5 if self.screen_off else 30)
+            now = pygame.time.get_ticks()
+            if now >= self._next_blink:
+                self._cursor_on = not self._cursor_on
+                self._next_blink = now + 500
+
+            # Static views (idle commands panel, chat menu) skip drawing until something changes
+            if self._needs_redraw or not self._frame_is_static():
+                # Last frame's duration, capped so a stall doesn't make animations jump
+                self._anim_step = min(self.clock.get_time(), 200) * 30 / 1000
+                self.draw()
+                self._needs_redraw = False
+            if self._settings_dirty_at is not None and time.monotonic() >= self._settings_dirty_at:
+                self._flush_settings()
+            if self.terminal.started and self.terminal.flush(time.monotonic()):
+                self._last_activity = time.monotonic()
+
+            # Full rate around input and pending replies, slow when idle, slowest when the screen is off
+            if self.screen_off:
+                fps = 5
+            elif (self.chat_waiting or self.command_running or
+                    time.monotonic() - self._last_activity < 0.5):
+                fps = 30
+            else:
+                fps = 10
+            self.clock.tick(fps)
 
+        self._flush_settings()
         self.terminal.stop()
         pygame.quit()
 